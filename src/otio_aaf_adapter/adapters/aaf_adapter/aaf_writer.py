@@ -249,8 +249,10 @@ class AAFFileTranscriber:
 def validate_metadata(timeline):
     """Print a check of necessary metadata requirements for an otio timeline."""
 
-    all_checks = [__check(timeline, "duration().rate")]
-    edit_rate = __check(timeline, "duration().rate").value
+    # Computing the timeline's duration walks the whole timeline, do it once.
+    edit_rate_check = __check(timeline, "duration().rate")
+    all_checks = [edit_rate_check]
+    edit_rate = edit_rate_check.value
 
     for child in timeline.find_children():
         checks = []
@@ -299,16 +301,16 @@ def _gather_clip_mob_ids(input_otio,
 
     def _from_media_reference_metadata(clip):
         """Get the MobID from the media_reference.metadata."""
-        return (clip.media_reference.metadata.get("AAF", {}).get("MobID") or
-                clip.media_reference.metadata.get("AAF", {}).get("SourceID"))
+        aaf_metadata = clip.media_reference.metadata.get("AAF", {})
+        return aaf_metadata.get("MobID") or aaf_metadata.get("SourceID")
 
     def _from_aaf_file(clip):
         """ Get the MobID from the AAF file itself."""
         mob_id = None
         if isinstance(clip.media_reference, otio.schema.ExternalReference):
             target_url = clip.media_reference.target_url
-            if os.path.isfile(target_url) and target_url.endswith("aaf"):
-                with aaf2.open(clip.media_reference.target_url) as aaf_file:
+            if target_url.endswith("aaf") and os.path.isfile(target_url):
+                with aaf2.open(target_url) as aaf_file:
                     mastermobs = list(aaf_file.content.mastermobs())
                     if len(mastermobs) == 1:
                         mob_id = mastermobs[0].mob_id
@@ -388,7 +390,8 @@ class _TrackTranscriber:
         self.compositionmob = root_file_transcriber.compositionmob
         self.aaf_file = root_file_transcriber.aaf_file
         self.otio_track = otio_track
-        self.edit_rate = self.otio_track.find_children()[0].duration().rate
+        # The first child is all we need, no need to collect the whole track.
+        self.edit_rate = self.otio_track[0].duration().rate
         self.timeline_mobslot, self.sequence = self._create_timeline_mobslot()
         self.timeline_mobslot.name = self.otio_track.name
 
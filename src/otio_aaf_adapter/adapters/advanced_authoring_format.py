@@ -37,6 +37,10 @@ _TRANSCRIBE_DEBUG = False
 # bake keyframed parameter
 _BAKE_KEYFRAMED_PROPERTIES_VALUES = False
 
+# MasterMobs transcribed during the current read_from_file() call, by mob id.
+# Every SourceClip pointing at the same MasterMob reuses the one transcription.
+_MOB_TIMELINE_CACHE = {}
+
 _PROPERTY_INTERPOLATION_MAP = {
     aaf2.misc.ConstantInterp: "Constant",
     aaf2.misc.LinearInterp: "Linear",
@@ -44,6 +48,21 @@ _PROPERTY_INTERPOLATION_MAP = {
     aaf2.misc.CubicInterpolator: "Cubic",
 }
 
+# AAF components that carry no editorial content for OTIO. _transcribe()
+# returns None for these before doing any metadata work.
+_IGNORED_TYPES = frozenset((
+    aaf2.components.Timecode,
+    aaf2.components.Pulldown,
+    aaf2.components.EdgeCode,
+))
+
+# OTIO classes the _simplify() pass checks on every node, looked up once.
+_TRACK_CLS = otio.schema.Track
+_STACK_CLS = otio.schema.Stack
+_GAP_CLS = otio.schema.Gap
+_COMPOSITION_CLS = otio.core.Composition
+_ITEM_CLS = otio.core.Item
+
 
 def _transcribe_log(s, indent=0, always_print=False):
     if always_print or _TRANSCRIBE_DEBUG:
@@ -368,6 +387,9 @@ def _add_child(parent, child, source):
 
 
 def _transcribe(item, parents, edit_rate, indent=0):
+    if type(item) in _IGNORED_TYPES:
+        return None
+
     result = None
     metadata = {}
 
@@ -402,17 +424,19 @@ def _transcribe(item, parents, edit_rate, indent=0):
         _transcribe_log(msg, indent)
         result = otio.schema.SerializableCollection()
 
+        child_parents = parents + [item]
         for mob in item.compositionmobs():
             _transcribe_log("compositionmob traversal", indent)
-            child = _transcribe(mob, parents + [item], edit_rate, indent + 2)
+            child = _transcribe(mob, child_parents, edit_rate, indent + 2)
             _add_child(result, child, mob)
 
     elif isinstance(item, aaf2.mobs.Mob):
         _transcribe_log(f"Creating Timeline for {_encoded_name(item)}", indent)
         result = otio.schema.Timeline()
 
+        child_parents = parents + [item]
         for slot in item.slots:
-            track = _transcribe(slot, parents + [item], edit_rate, indent + 2)
+            track = _transcribe(slot, child_parents, edit_rate, indent + 2)
             _add_child(result.tracks, track, slot)
 
             # Use a heuristic to find the starting timecode from
@@ -426,14 +450,16 @@ def _transcribe(item, parents, edit_rate, indent=0):
         if item.mob is not None:
             clipUsage = item.mob.usage
 
-        if clipUsage:
-            itemMsg = "Creating SourceClip for {} ({})".format(
-                _encoded_name(item), clipUsage
-            )
-        else:
-            itemMsg = f"Creating SourceClip for {_encoded_name(item)}"
+        # Naming a SourceClip resolves its mob, only do it when logging.
+        if _TRANSCRIBE_DEBUG:
+            if clipUsage:
+                itemMsg = "Creating SourceClip for {} ({})".format(
+                    _encoded_name(item), clipUsage
+                )
+            else:
+                itemMsg = f"Creating SourceClip for {_encoded_name(item)}"
 
-        _transcribe_log(itemMsg, indent)
+            _transcribe_log(itemMsg, indent)
         result = otio.schema.Clip()
 
         # store source mob usage to allow OTIO pipelines to adapt downstream
@@ -506,8 +532,19 @@ def _transcribe(item, parents, edit_rate, indent=0):
         mastermob = child_mastermob or parent_mastermob or None
 
         if mastermob:
+            # Only the metadata of the transcribed MasterMob is used below, so
+            # one transcription serves all the clips that reference it.
+            mastermob_child = _MOB_TIMELINE_CACHE.get(mastermob.mob_id)
+            if mastermob_child is None:
+                mastermob_child = _transcribe(mastermob, list(), edit_rate, indent)
+                _MOB_TIMELINE_CACHE[mastermob.mob_id] = mastermob_child
+            else:
+                _transcribe_log(
+                    "[reusing transcribed MasterMob {}]".format(mastermob.mob_id),
+                    indent
+                )
+
             # Get target path
-            mastermob_child = _transcribe(mastermob, list(), edit_rate, indent)
 
             target_path = (mastermob_child.metadata.get("AAF", {})
                                                    .get("UserComments", {})
@@ -603,8 +640,9 @@ def _transcribe(item, parents, edit_rate, indent=0):
         # TODO: Is this the right class?
         result = otio.schema.Stack()
 
+        child_parents = parents + [item]
         for slot in item.slots:
-            child = _transcribe(slot, parents + [item], edit_rate, indent + 2)
+            child = _transcribe(slot, child_parents, edit_rate, indent + 2)
             _add_child(result, child, slot)
 
     elif isinstance(item, aaf2.components.Sequence):
@@ -625,8 +663,9 @@ def _transcribe(item, parents, edit_rate, indent=0):
                     metadata["PhysicalTrackNumber"] = slot_index
                 metadata["SlotID"] = int(timeline_slot["SlotID"].value)
 
+        child_parents = parents + [item]
         for component in item.components:
-            child = _transcribe(component, parents + [item], edit_rate, indent + 2)
+            child = _transcribe(component, child_parents, edit_rate, indent + 2)
             _add_child(result, child, component)
 
     elif isinstance(item, aaf2.components.OperationGroup):
@@ -652,15 +691,6 @@ def _transcribe(item, parents, edit_rate, indent=0):
         child = _transcribe(item.segment, parents + [item], edit_rate, indent + 2)
         _add_child(result, child, item.segment)
 
-    elif isinstance(item, aaf2.components.Timecode):
-        pass
-
-    elif isinstance(item, aaf2.components.Pulldown):
-        pass
-
-    elif isinstance(item, aaf2.components.EdgeCode):
-        pass
-
     elif isinstance(item, aaf2.components.ScopeReference):
         msg = f"Creating Gap for ScopedReference for {_encoded_name(item)}"
         _transcribe_log(msg, indent)
@@ -727,6 +757,7 @@ def _transcribe(item, parents, edit_rate, indent=0):
 
         selected = item.getvalue('Selected')
         alternates = item.getvalue('Alternates', None)
+        child_parents = parents + [item]
 
         # First we check to see if the Selected component is either a Filler
         # or ScopeReference object, meaning we have to use the alternate instead
@@ -739,7 +770,7 @@ def _transcribe(item, parents, edit_rate, indent=0):
                 err = "AAF Selector parsing error: object has unexpected number of " \
                       "alternates - {}".format(len(alternates))
                 raise AAFAdapterError(err)
-            result = _transcribe(alternates[0], parents + [item], edit_rate, indent + 2)
+            result = _transcribe(alternates[0], child_parents, edit_rate, indent + 2)
 
             # Filler/ScopeReference means the clip is muted/not enabled
             result.enabled = False
@@ -752,7 +783,7 @@ def _transcribe(item, parents, edit_rate, indent=0):
         else:
 
             # This is most likely a multi-cam clip
-            result = _transcribe(selected, parents + [item], edit_rate, indent + 2)
+            result = _transcribe(selected, child_parents, edit_rate, indent + 2)
 
             # Perform a check here to make sure no potential Gap objects
             # are slipping through the cracks
@@ -764,7 +795,7 @@ def _transcribe(item, parents, edit_rate, indent=0):
             # editorial decision - we do a full parse on those obects too
             if alternates is not None:
                 alternates = [
-                    _transcribe(alt, parents + [item], edit_rate, indent + 2)
+                    _transcribe(alt, child_parents, edit_rate, indent + 2)
                     for alt in alternates
                 ]
 
@@ -821,8 +852,9 @@ def _transcribe(item, parents, edit_rate, indent=0):
         _transcribe_log(msg, indent)
 
         result = otio.schema.SerializableCollection()
+        child_parents = parents + [item]
         for child in item:
-            result.append(_transcribe(child, parents + [item], edit_rate, indent + 2))
+            result.append(_transcribe(child, child_parents, edit_rate, indent + 2))
     else:
         # For everything else, we just ignore it.
         # To see what is being ignored, turn on the debug flag
@@ -1148,8 +1180,9 @@ def _transcribe_operation_group(item, parents, metadata, edit_rate, indent):
             }
         })
 
+    child_parents = parents + [item]
     for segment in item.getvalue("InputSegments"):
-        child = _transcribe(segment, parents + [item], edit_rate, indent)
+        child = _transcribe(segment, child_parents, edit_rate, indent)
         if child:
             _add_child(result, child, segment)
 
@@ -1163,48 +1196,47 @@ def _fix_transitions(thing):
         isinstance(thing, otio.core.Composition)
         or isinstance(thing, otio.schema.SerializableCollection)
     ):
-        if isinstance(thing, otio.schema.Track):
-            for c, child in enumerate(thing):
-
-                # Don't touch the Transitions themselves,
-                # only the Clips & Gaps next to them.
-                if not isinstance(child, otio.core.Item):
-                    continue
-
-                # Was the item before us a Transition?
-                if c > 0 and isinstance(
-                    thing[c - 1],
-                    otio.schema.Transition
-                ):
-                    pre_trans = thing[c - 1]
-
-                    if child.source_range is None:
-                        child.source_range = child.trimmed_range()
-                    csr = child.source_range
-                    child.source_range = otio.opentime.TimeRange(
-                        start_time=csr.start_time + pre_trans.in_offset,
-                        duration=csr.duration - pre_trans.in_offset
-                    )
-
-                # Is the item after us a Transition?
-                if c < len(thing) - 1 and isinstance(
-                    thing[c + 1],
-                    otio.schema.Transition
-                ):
-                    post_trans = thing[c + 1]
-
-                    if child.source_range is None:
-                        child.source_range = child.trimmed_range()
-                    csr = child.source_range
-                    child.source_range = otio.opentime.TimeRange(
-                        start_time=csr.start_time,
-                        duration=csr.duration - post_trans.out_offset
-                    )
+        is_track = isinstance(thing, otio.schema.Track)
+        last_index = len(thing) - 1
+        for c, child in enumerate(thing):
+            # Don't touch the Transitions themselves,
+            # only the Clips & Gaps next to them.
+            if is_track and isinstance(child, otio.core.Item):
+                _trim_for_adjacent_transitions(
+                    child,
+                    thing[c - 1] if c > 0 else None,
+                    thing[c + 1] if c < last_index else None
+                )
 
-        for child in thing:
             _fix_transitions(child)
 
 
+def _trim_for_adjacent_transitions(child, before, after):
+    """Shortens `child` by the overlap of the Transitions `before`/`after` it."""
+    pre_trans = before if isinstance(before, otio.schema.Transition) else None
+    post_trans = after if isinstance(after, otio.schema.Transition) else None
+    if pre_trans is None and post_trans is None:
+        return
+
+    csr = child.trimmed_range()
+    start_time = csr.start_time
+    duration = csr.duration
+
+    # Was the item before us a Transition?
+    if pre_trans is not None:
+        start_time = start_time + pre_trans.in_offset
+        duration = duration - pre_trans.in_offset
+
+    # Is the item after us a Transition?
+    if post_trans is not None:
+        duration = duration - post_trans.out_offset
+
+    child.source_range = otio.opentime.TimeRange(
+        start_time=start_time,
+        duration=duration
+    )
+
+
 def _find_child_at_time(target_track, start_time):
     """same as child_at_time but passes through transitions"""
 
@@ -1239,10 +1271,11 @@ def _attach_markers(collection):
     """
     # iterate all timeline objects
     for timeline in collection.find_children(descended_from_type=otio.schema.Timeline):
+        tracks = timeline.find_children(descended_from_type=otio.schema.Track)
         tracks_map = {}
 
         # build track mapping
-        for track in timeline.find_children(descended_from_type=otio.schema.Track):
+        for track in tracks:
             metadata = track.metadata.get("AAF", {})
             slot_id = metadata.get("SlotID")
             track_number = metadata.get("PhysicalTrackNumber")
@@ -1252,9 +1285,10 @@ def _attach_markers(collection):
             tracks_map[(int(slot_id), int(track_number))] = track
 
         # iterate all tracks for their markers and attach them to the matching item
-        for current_track in timeline.find_children(
-                descended_from_type=otio.schema.Track):
+        for current_track in tracks:
             for marker in list(current_track.markers):
+                # marked_range hands out a new TimeRange on every access
+                marked_range = marker.marked_range
                 metadata = marker.metadata.get("AAF", {})
                 slot_id = metadata.get("AttachedSlotID")
                 track_number = metadata.get("AttachedPhysicalTrackNumber")
@@ -1277,18 +1311,18 @@ def _attach_markers(collection):
 
                     # transform marked range into new item range
                     marked_start_local = current_track.transformed_time(
-                        marker.marked_range.start_time, target_item
+                        marked_range.start_time, target_item
                     )
 
                     marker.marked_range = otio.opentime.TimeRange(
                         start_time=marked_start_local,
-                        duration=marker.marked_range.duration,
+                        duration=marked_range.duration,
                     )
 
                 else:
                     try:
                         target_item = _find_child_at_time(
-                            target_track, marker.marked_range.start_time)
+                            target_track, marked_range.start_time)
 
                         if target_item is None or not hasattr(target_item, 'markers'):
                             # Item found cannot have markers, for example Transition.
@@ -1304,12 +1338,12 @@ def _attach_markers(collection):
 
                         # transform marked range into new item range
                         marked_start_local = current_track.transformed_time(
-                            marker.marked_range.start_time, target_item
+                            marked_range.start_time, target_item
                         )
 
                         marker.marked_range = otio.opentime.TimeRange(
                             start_time=marked_start_local,
-                            duration=marker.marked_range.duration
+                            duration=marked_range.duration
                         )
 
                     except otio.exceptions.CannotComputeAvailableRangeError as e:
@@ -1343,148 +1377,227 @@ def _attach_markers(collection):
     return collection
 
 
-def _simplify(thing):
+def _simplify(thing, valuable_cache=None):
     # If the passed in is an empty dictionary or None, nothing to do.
     # Without this check it would still return thing, but this way we avoid
     # unnecessary if-chain compares.
     if not thing:
         return thing
 
+    # Results of _contains_something_valuable() are shared across the whole
+    # pass, so nested Stacks don't rescan the subtrees of their descendants.
+    if valuable_cache is None:
+        valuable_cache = {}
+
     if isinstance(thing, otio.schema.SerializableCollection):
-        if len(thing) == 1:
-            return _simplify(thing[0])
-        else:
-            for c, child in enumerate(thing):
-                thing[c] = _simplify(child)
-            return thing
+        return _simplify_collection(thing, valuable_cache)
 
     elif isinstance(thing, otio.schema.Timeline):
-        result = _simplify(thing.tracks)
+        return _simplify_timeline(thing, valuable_cache)
+
+    elif isinstance(thing, _COMPOSITION_CLS):
+        return _simplify_composition(thing, valuable_cache)
+
+    return _simplify_leaf(thing, valuable_cache)
 
+
+def _simplify_collection(thing, valuable_cache):
+    if len(thing) == 1:
+        return _simplify(thing[0], valuable_cache)
+
+    for c, child in enumerate(thing):
+        thing[c] = _simplify(child, valuable_cache)
+    return thing
+
+
+def _simplify_timeline(thing, valuable_cache):
+    tracks = thing.tracks
+    if not tracks or _is_flat_stack(tracks, valuable_cache):
+        return thing
+
+    _simplify_composition_contents(tracks, valuable_cache)
+
+    if _is_redundant_container(tracks):
         # Only replace the Timeline's stack if the simplified result
-        # was also a Stack. Otherwise leave it (the contents will have
+        # would also be a Stack. Otherwise leave it (the contents have
         # been simplified in place).
-        if isinstance(result, otio.schema.Stack):
-            thing.tracks = result
-
+        if isinstance(tracks[0], _STACK_CLS):
+            thing.tracks = _collapse_redundant_container(tracks, valuable_cache)
         return thing
 
-    elif isinstance(thing, otio.core.Composition):
-        # simplify our children
-        for c, child in enumerate(thing):
-            thing[c] = _simplify(child)
-
-        # remove empty children of Stacks
-        if isinstance(thing, otio.schema.Stack):
-            for c in reversed(range(len(thing))):
-                child = thing[c]
-                if not _contains_something_valuable(child):
-                    # TODO: We're discarding metadata... should we retain it?
-                    del thing[c]
-
-            # Look for Stacks within Stacks
-            c = len(thing) - 1
-            while c >= 0:
-                child = thing[c]
-                # Is my child a Stack also? (with no effects)
-                if (
-                    not _has_effects(child)
-                    and
-                    (
-                        isinstance(child, otio.schema.Stack)
-                        or (
-                            isinstance(child, otio.schema.Track)
-                            and len(child) == 1
-                            and isinstance(child[0], otio.schema.Stack)
-                            and child[0]
-                            and isinstance(child[0][0], otio.schema.Track)
-                        )
-                    )
-                ):
-                    if isinstance(child, otio.schema.Track):
-                        child = child[0]
-
-                    # Pull the child's children into the parent
-                    num = len(child)
-                    children_of_child = child[:]
-                    # clear out the ownership of 'child'
-                    del child[:]
-                    thing[c:c + 1] = children_of_child
-
-                    # TODO: We may be discarding metadata, should we merge it?
-                    # TODO: Do we need to offset the markers in time?
-                    thing.markers.extend(child.markers)
-                    # Note: we don't merge effects, because we already made
-                    # sure the child had no effects in the if statement above.
-
-                    # Preserve the enabled/disabled state as we merge these two.
-                    thing.enabled = thing.enabled and child.enabled
-
-                    c = c + num
-                c = c - 1
-
-        # skip redundant containers
-        if _is_redundant_container(thing):
-            # TODO: We may be discarding metadata here, should we merge it?
-            result = thing[0].deepcopy()
-
-            # As we are reducing the complexity of the object structure through
-            # this process, we need to make sure that any/all enabled statuses
-            # are being respected and applied in an appropriate way
-            if not thing.enabled:
-                result.enabled = False
-
-            # TODO: Do we need to offset the markers in time?
-            result.markers.extend(thing.markers)
-
-            # TODO: The order of the effects is probably important...
-            # should they be added to the end or the front?
-            # Intuitively it seems like the child's effects should come before
-            # the parent's effects. This will need to be solidified when we
-            # add more effects support.
-            result.effects.extend(thing.effects)
-            # Keep the parent's length, if it has one
-            if thing.source_range:
-                # make sure it has a source_range first
-                try:
-                    if not result.source_range:
-                        result.source_range = result.trimmed_range()
-                    # modify the duration and combine start_times
-                    result.source_range = otio.opentime.TimeRange(
-                        result.source_range.start_time + thing.source_range.start_time,
-                        thing.source_range.duration
+    _ensure_top_level_stack_tracks(tracks)
+    return thing
+
+
+def _is_flat_stack(thing, valuable_cache):
+    """Returns True if `thing` is already as simple as _simplify() would make it.
+
+    That is the case when every child is a valuable Track without nested
+    compositions, as in timelines written by OTIO itself.
+    """
+    for track in thing:
+        if not isinstance(track, _TRACK_CLS):
+            return False
+        if any(isinstance(child, _COMPOSITION_CLS) for child in track):
+            return False
+        if not _contains_something_valuable(track, valuable_cache):
+            return False
+    return True
+
+
+def _simplify_composition(thing, valuable_cache):
+    _simplify_composition_contents(thing, valuable_cache)
+
+    # skip redundant containers
+    if _is_redundant_container(thing):
+        return _collapse_redundant_container(thing, valuable_cache)
+
+    _ensure_top_level_stack_tracks(thing)
+    return thing
+
+
+def _simplify_leaf(thing, valuable_cache):
+    # Clips, Gaps, Transitions etc. have nothing to simplify.
+    return thing
+
+
+def _simplify_composition_contents(thing, valuable_cache):
+    # simplify our children
+    for c, child in enumerate(thing):
+        thing[c] = _simplify(child, valuable_cache)
+
+    # remove empty children of Stacks
+    if isinstance(thing, _STACK_CLS):
+        for c in reversed(range(len(thing))):
+            child = thing[c]
+            if not _contains_something_valuable(child, valuable_cache):
+                # TODO: We're discarding metadata... should we retain it?
+                del thing[c]
+
+        # Look for Stacks within Stacks
+        c = len(thing) - 1
+        while c >= 0:
+            child = thing[c]
+            # Is my child a Stack also? (with no effects)
+            if (
+                not _has_effects(child)
+                and
+                (
+                    isinstance(child, _STACK_CLS)
+                    or (
+                        isinstance(child, _TRACK_CLS)
+                        and len(child) == 1
+                        and isinstance(child[0], _STACK_CLS)
+                        and child[0]
+                        and isinstance(child[0][0], _TRACK_CLS)
                     )
-                except otio.exceptions.CannotComputeAvailableRangeError:
-                    result.source_range = copy.copy(thing.source_range)
+                )
+            ):
+                if isinstance(child, _TRACK_CLS):
+                    child = child[0]
+
+                # Pull the child's children into the parent
+                num = len(child)
+                children_of_child = child[:]
+                # clear out the ownership of 'child'
+                del child[:]
+                thing[c:c + 1] = children_of_child
+
+                # TODO: We may be discarding metadata, should we merge it?
+                # TODO: Do we need to offset the markers in time?
+                thing.markers.extend(child.markers)
+                # Note: we don't merge effects, because we already made
+                # sure the child had no effects in the if statement above.
+
+                # Preserve the enabled/disabled state as we merge these two.
+                thing.enabled = thing.enabled and child.enabled
+
+                c = c + num
+            c = c - 1
+
+
+def _collapse_redundant_container(thing, valuable_cache):
+    # TODO: We may be discarding metadata here, should we merge it?
+    # thing is about to be discarded, so rather than copying its only child
+    # we take it out of thing and hand it back to be reparented.
+    result = thing[0]
+    del thing[0]
+
+    # result may gain markers and effects below, so forget what we knew
+    # about its value.
+    valuable_cache.pop(result, None)
+
+    # As we are reducing the complexity of the object structure through
+    # this process, we need to make sure that any/all enabled statuses
+    # are being respected and applied in an appropriate way
+    if not thing.enabled:
+        result.enabled = False
+
+    # TODO: Do we need to offset the markers in time?
+    result.markers.extend(thing.markers)
+
+    # TODO: The order of the effects is probably important...
+    # should they be added to the end or the front?
+    # Intuitively it seems like the child's effects should come before
+    # the parent's effects. This will need to be solidified when we
+    # add more effects support.
+    result.effects.extend(thing.effects)
+    # Keep the parent's length, if it has one
+    if thing.source_range:
+        if (
+            result.source_range is None
+            and isinstance(result, otio.schema.Clip)
+            and result.media_reference.available_range is None
+        ):
+            # Nothing to combine with, so don't bother letting
+            # trimmed_range() raise CannotComputeAvailableRangeError.
+            result.source_range = copy.copy(thing.source_range)
             return result
 
+        # make sure it has a source_range first
+        try:
+            if not result.source_range:
+                result.source_range = result.trimmed_range()
+            # modify the duration and combine start_times
+            result.source_range = otio.opentime.TimeRange(
+                result.source_range.start_time + thing.source_range.start_time,
+                thing.source_range.duration
+            )
+        except otio.exceptions.CannotComputeAvailableRangeError:
+            # e.g. a nested composition holding such a clip
+            result.source_range = copy.copy(thing.source_range)
+    return result
+
+
+def _ensure_top_level_stack_tracks(thing):
     # if thing is the top level stack, all of its children must be in tracks
-    if isinstance(thing, otio.schema.Stack) and thing.parent() is None:
-        children_needing_tracks = []
-        for child in thing:
-            if isinstance(child, otio.schema.Track):
-                continue
-            children_needing_tracks.append(child)
+    if not isinstance(thing, _STACK_CLS) or thing.parent() is not None:
+        return
 
-        for child in children_needing_tracks:
-            orig_index = thing.index(child)
-            del thing[orig_index]
-            new_track = otio.schema.Track()
-            new_track.append(child)
-            thing.insert(orig_index, new_track)
+    # the common case: nothing to wrap
+    if all(isinstance(child, _TRACK_CLS) for child in thing):
+        return
 
-    return thing
+    # Each child is swapped for its wrapping track in place, so the
+    # indices of the remaining children don't move.
+    for orig_index, child in enumerate(thing[:]):
+        if isinstance(child, _TRACK_CLS):
+            continue
+        del thing[orig_index]
+        new_track = otio.schema.Track()
+        new_track.append(child)
+        thing.insert(orig_index, new_track)
 
 
 def _has_effects(thing):
-    if isinstance(thing, otio.core.Item):
+    if isinstance(thing, _ITEM_CLS):
         if len(thing.effects) > 0:
             return True
 
 
 def _is_redundant_container(thing):
 
-    is_composition = isinstance(thing, otio.core.Composition)
+    is_composition = isinstance(thing, _COMPOSITION_CLS)
     if not is_composition:
         return False
 
@@ -1492,42 +1605,42 @@ def _is_redundant_container(thing):
     if not has_one_child:
         return False
 
+    is_track = type(thing) is _TRACK_CLS
+    if not is_track:
+        return True
+
+    parent = thing.parent()
     am_top_level_track = (
-        type(thing) is otio.schema.Track
-        and type(thing.parent()) is otio.schema.Stack
-        and thing.parent().parent() is None
+        type(parent) is _STACK_CLS
+        and parent.parent() is None
     )
 
     return (
         not am_top_level_track
         # am a top level track but my only child is a track
-        or (
-            type(thing) is otio.schema.Track
-            and type(thing[0]) is otio.schema.Track
-        )
+        or type(thing[0]) is _TRACK_CLS
     )
 
 
-def _contains_something_valuable(thing):
-    if isinstance(thing, otio.core.Item):
-        if len(thing.effects) > 0 or len(thing.markers) > 0:
+def _shallow_valuable(thing, valuable_cache):
+    """Returns whether `thing` is valuable judging by `thing` alone, or None if
+    it is a composition whose children need to be looked at.
+    """
+    if isinstance(thing, _ITEM_CLS):
+        if thing.effects or thing.markers:
             return True
 
-    if isinstance(thing, otio.core.Composition):
+    if isinstance(thing, _COMPOSITION_CLS):
 
-        if len(thing) == 0:
+        if not thing:
             # NOT valuable because it is empty
             return False
 
-        for child in thing:
-            if _contains_something_valuable(child):
-                # valuable because this child is valuable
-                return True
-
-        # none of the children were valuable, so thing is NOT valuable
-        return False
+        # The cache is keyed by the object itself (not its id) so that it
+        # keeps the compositions alive and ids can't be recycled under it.
+        return valuable_cache.get(thing)
 
-    if isinstance(thing, otio.schema.Gap):
+    if isinstance(thing, _GAP_CLS):
         # TODO: Are there other valuable things we should look for on a Gap?
         return False
 
@@ -1535,6 +1648,50 @@ def _contains_something_valuable(thing):
     return True
 
 
+def _contains_something_valuable(thing, valuable_cache=None):
+    if valuable_cache is None:
+        valuable_cache = {}
+
+    valuable = _shallow_valuable(thing, valuable_cache)
+    if valuable is not None:
+        return valuable
+
+    # Walk the subtree with an explicit stack rather than recursion, so that
+    # deeply nested AAF structures can't run into the recursion limit.
+    # Each entry is a composition and an iterator over the nested
+    # compositions among its children that still need to be searched.
+    stack = []
+    composition = thing
+    while composition is not None:
+        # Settle every child that can be judged on its own before descending
+        # into any nested composition, so a valuable clip ends the search
+        # without walking the deeper subtrees next to it first.
+        nested = []
+        for child in composition:
+            valuable = _shallow_valuable(child, valuable_cache)
+            if valuable is None:
+                nested.append(child)
+            elif valuable:
+                # valuable because this child is valuable, and so is
+                # every composition above it
+                valuable_cache[composition] = True
+                for ancestor, _ in stack:
+                    valuable_cache[ancestor] = True
+                return True
+        stack.append((composition, iter(nested)))
+
+        composition = None
+        while stack and composition is None:
+            parent, remaining = stack[-1]
+            composition = next(remaining, None)
+            if composition is None:
+                # none of the children were valuable, so parent is NOT valuable
+                valuable_cache[parent] = False
+                stack.pop()
+
+    return False
+
+
 def _get_mobs_for_transcription(storage):
     """
     When we describe our AAF into OTIO space, we apply the following heuristic:
@@ -1608,14 +1765,23 @@ def read_from_file(
     _TRANSCRIBE_DEBUG = transcribe_log
     _BAKE_KEYFRAMED_PROPERTIES_VALUES = bake_keyframed_properties
 
-    with aaf2.open(filepath) as aaf_file:
-        # Note: We're skipping: aaf_file.header
-        # Is there something valuable in there?
+    # Mob ids are only trusted within a single file, a MasterMob exported
+    # again later may carry different metadata under the same id.
+    _MOB_TIMELINE_CACHE.clear()
+
+    try:
+        with aaf2.open(filepath) as aaf_file:
+            # Note: We're skipping: aaf_file.header
+            # Is there something valuable in there?
 
-        storage = aaf_file.content
-        mobs_to_transcribe = _get_mobs_for_transcription(storage)
+            storage = aaf_file.content
+            mobs_to_transcribe = _get_mobs_for_transcription(storage)
 
-        result = _transcribe(mobs_to_transcribe, parents=list(), edit_rate=None)
+            result = _transcribe(mobs_to_transcribe, parents=list(), edit_rate=None)
+    finally:
+        # Don't keep the transcribed MasterMobs alive past this read, even
+        # when transcription fails part way.
+        _MOB_TIMELINE_CACHE.clear()
 
     # OTIO represents transitions a bit different than AAF, so
     # we need to iterate over them and modify the items on either side.
@@ -1662,10 +1828,14 @@ def write_to_file(input_otio, filepath, **kwargs):
             if not default_edit_rate:
                 default_edit_rate = transcriber.edit_rate
 
+            # Hand the components to the sequence in one go, every append()
+            # is a separate extend() on the aaf2 property.
+            components = []
             for otio_child in otio_track:
                 result = transcriber.transcribe(otio_child)
                 if result:
-                    transcriber.sequence.components.append(result)
+                    components.append(result)
+            transcriber.sequence.components.extend(components)
 
         # Always add a timecode track to the main composition mob.
         # This is required for compatibility with DaVinci Resolve.
@@ -4,12 +4,21 @@
 """Test the AAF adapter."""
 
 # python
+import collections
+import collections.abc
+import contextlib
+import copy
+import functools
+import itertools
+import json
 import os
 import sys
 import unittest
 import tempfile
 import io
 
+import pytest
+
 import opentimelineio as otio
 from otio_aaf_adapter.adapters.aaf_adapter.aaf_writer import (
     AAFAdapterError,
@@ -17,46 +26,11 @@ from otio_aaf_adapter.adapters.aaf_adapter.aaf_writer import (
 )
 
 # module needs to be imported for code coverage to work
-import otio_aaf_adapter.adapters.advanced_authoring_format  # noqa: F401
-
-
-TRANSCRIPTION_RESULT = """---
-Transcribing top level mobs
----
-Creating SerializableCollection for Iterable for list
-  Creating Timeline for SubclipTSVNoData_NoVideo.Exported.02
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-    Creating Track for TimelineMobSlot for DX
-      Creating Track for Sequence for Sequence
-        Creating operationGroup for OperationGroup
-          Creating SourceClip for Subclip.BREATH (Usage_SubClip)
-          [found child_mastermob]
-          Creating Timeline for subclip
-            Creating Track for TimelineMobSlot for TimelineMobSlot
-              Creating SourceClip for x000-0000_01_Xxxxx_Xxx.aaf
-              [found no mastermob]
-            Creating Track for MobSlot for EventMobSlot
-              Creating Track for Sequence for Sequence
-                Create marker for DescriptiveMarker
-    Creating Track for MobSlot for EventMobSlot
-      Creating Track for Sequence for Sequence
-        Create marker for DescriptiveMarker
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-      Creating Track for Sequence for Sequence
-        Creating Gap for Filler
-    Creating Track for TimelineMobSlot for TimelineMobSlot
-Marker: NEED PDX (time: 360567.0), attached to item: Subclip.BREATH
-"""
-
-
-SAMPLE_DATA_DIR = os.path.join(os.path.dirname(__file__), "sample_data")
+from otio_aaf_adapter.adapters import advanced_authoring_format
+
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_DATA_DIR = os.path.join(TEST_DIR, "sample_data")
 SIMPLE_EXAMPLE_PATH = os.path.join(
     SAMPLE_DATA_DIR,
     "simple.aaf"
@@ -205,6 +179,11 @@ MULTIPLE_MARKER_OVER_TRANSITION_TXT_PATH = os.path.join(
     "multiple-markers-over-transitions.txt",
 )
 
+EXPECTED_TRANSCRIPTION_TXT_PATH = os.path.join(
+    SAMPLE_DATA_DIR,
+    "expected_transcription.txt",
+)
+
 MARKER_OVER_AUDIO_PATH = os.path.join(
     SAMPLE_DATA_DIR,
     "marker-over-audio.aaf"
@@ -225,6 +204,362 @@ NESTED_AUDIO_DISSOLVE_PATH = os.path.join(
 )
 
 
+# Expected ranges for the simple, trims and transitions samples, which are all
+# 24 fps. Built once at import rather than on every test run.
+_SAMPLE_RATE = 24.0
+
+
+def _tc_range(start, duration, rate=_SAMPLE_RATE):
+    return otio.opentime.TimeRange(
+        otio.opentime.from_timecode(start, rate),
+        otio.opentime.from_timecode(duration, rate)
+    )
+
+
+def _frame_ranges(table, rate=_SAMPLE_RATE):
+    """Build a tuple of TimeRanges from (start frame, duration frames) pairs."""
+    RationalTime = otio.opentime.RationalTime
+    TimeRange = otio.opentime.TimeRange
+    return tuple(
+        TimeRange(RationalTime(start, rate), RationalTime(duration, rate))
+        for start, duration in table
+    )
+
+
+_SIMPLE_DESIRED_SOURCE_RANGES = (
+    _tc_range("01:00:00:00", "00:00:30:00"),
+    _tc_range("01:00:00:00", "00:00:20:00"),
+    _tc_range("01:00:00:00", "00:00:30:02"),
+    _tc_range("01:00:00:00", "00:00:26:16"),
+    _tc_range("01:00:00:00", "00:00:30:00"),
+)
+
+_TRIMS_DESIRED_SOURCE_RANGES = _frame_ranges((
+    (86400, 720 - 0),
+    (86400 + 121, 480 - 121),
+    (86400 + 123, 523 - 123),
+    (0, 559 - 0),
+    (86400 + 69, 720 - 69),
+))
+
+_TRIMS_DESIRED_RANGES_IN_PARENT = (
+    _tc_range("00:00:00:00", "00:00:30:00"),
+    _tc_range("00:00:30:00", "00:00:14:23"),
+    _tc_range("00:00:44:23", "00:00:16:16"),
+    _tc_range("00:01:01:15", "00:00:23:07"),
+    _tc_range("00:01:24:22", "00:00:04:12"),  # Gap
+    _tc_range("00:01:29:10", "00:00:27:03"),
+)
+
+_TRANSITIONS_DESIRED_SOURCE_RANGES = _frame_ranges((
+    (86400 + 0, 117),
+    (86400 + 123, 200 - 123),
+    (55, 199 - 55),
+    (86400 + 0, 130),
+))
+
+_TRANSITIONS_DESIRED_RANGES_IN_PARENT = (
+    _tc_range("00:00:00:00", "00:00:00:00"),  # Gap
+    _tc_range("00:00:00:00", "00:00:00:12"),  # Transition
+    _tc_range("00:00:00:00", "00:00:04:21"),  # tech.fux
+    _tc_range("00:00:02:21", "00:00:02:00"),  # Transition
+    _tc_range("00:00:04:21", "00:00:03:05"),  # t-hawk
+    _tc_range("00:00:07:14", "00:00:01:00"),  # Transition
+    _tc_range("00:00:08:02", "00:00:02:05"),  # Gap
+    _tc_range("00:00:09:07", "00:00:02:00"),  # Transition
+    _tc_range("00:00:10:07", "00:00:06:00"),  # KOLL-HD
+    _tc_range("00:00:16:07", "00:00:05:10"),  # brokchrd
+    _tc_range("00:00:19:17", "00:00:02:00"),  # Transition
+    _tc_range("00:00:21:17", "00:00:00:00"),  # Gap
+)
+
+# Trimmed ranges of the outer clips, then the nested clips, of the nesting
+# sample.
+_NESTING_DESIRED_TRIMMED_RANGES = _frame_ranges((
+    (24, 16),
+    (86400 + 32, 16),
+    (40, 8),
+    (86400 + 24, 8),
+))
+
+# The 100 frame range the writer tests build their clips and references from.
+_WRITER_CLIP_RANGE = otio.opentime.TimeRange(
+    otio.opentime.RationalTime(0, 24),
+    otio.opentime.RationalTime(100, 24),
+)
+
+
+# AAF metadata keys that always differ between a flattened multitrack sample
+# and its preflattened counterpart.
+_FLATTEN_IGNORED_AAF_KEYS = (
+    'ComponentAttributeList',
+    'DataDefinition',
+    'Length',
+    'StartTime',
+)
+
+
+# Per effect parameter summaries of the keyframed sample, read without and
+# with bake_keyframed_properties.
+_KEYFRAMED_EXPECTED_UNBAKED = [
+    {
+        "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
+        "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
+        "AvidParameterByteOrder": {"baked_sample_count": None, "keyframed": False},
+        "DVE_BORDER_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_SCALE_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_SCALE_X_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_SCALE_Y_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
+        "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
+        "AvidParameterByteOrder": {"baked_sample_count": None, "keyframed": False},
+        "DVE_BORDER_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_ROT_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_ROT_X_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_ROT_Y_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_ROT_Z_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
+        "Vergence": {"baked_sample_count": None, "keyframed": True},
+    },
+    {
+        "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
+        "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
+        "AvidParameterByteOrder": {"baked_sample_count": None, "keyframed": False},
+        "DVE_BORDER_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_POS_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_POS_X_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_POS_Y_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_POS_Z_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
+        "Vergence": {"baked_sample_count": None, "keyframed": True},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
+        "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
+        "AvidParameterByteOrder": {"baked_sample_count": None, "keyframed": False},
+        "DVE_BORDER_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_PRSP_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_PRSP_X_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_PRSP_Y_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_PRSP_Z_U": {"baked_sample_count": None, "keyframed": True},
+        "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
+        "Vergence": {"baked_sample_count": None, "keyframed": True},
+    },
+]
+
+_KEYFRAMED_EXPECTED_BAKED = [
+    {
+        "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
+        "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
+        "AvidParameterByteOrder": {"baked_sample_count": None, "keyframed": False},
+        "DVE_BORDER_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_SCALE_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_SCALE_X_U": {"baked_sample_count": 212, "keyframed": True},
+        "DVE_SCALE_Y_U": {"baked_sample_count": 212, "keyframed": True},
+        "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
+        "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
+        "AvidParameterByteOrder": {"baked_sample_count": None, "keyframed": False},
+        "DVE_BORDER_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_ROT_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_ROT_X_U": {"baked_sample_count": 159, "keyframed": True},
+        "DVE_ROT_Y_U": {"baked_sample_count": 159, "keyframed": True},
+        "DVE_ROT_Z_U": {"baked_sample_count": 159, "keyframed": True},
+        "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
+        "Vergence": {"baked_sample_count": 159, "keyframed": True},
+    },
+    {
+        "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
+        "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
+        "AvidParameterByteOrder": {"baked_sample_count": None, "keyframed": False},
+        "DVE_BORDER_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_POS_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_POS_X_U": {"baked_sample_count": 116, "keyframed": True},
+        "DVE_POS_Y_U": {"baked_sample_count": 116, "keyframed": True},
+        "DVE_POS_Z_U": {"baked_sample_count": 116, "keyframed": True},
+        "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
+        "Vergence": {"baked_sample_count": 116, "keyframed": True},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": 276, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 276, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": 182, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 182, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": 219, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 219, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": 193, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 193, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AvidMotionInputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionOutputFormat": {"baked_sample_count": None, "keyframed": False},
+        "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
+        "AvidPhase": {"baked_sample_count": None, "keyframed": False},
+        "PARAM_SPEED_MAP_U": {"baked_sample_count": 241, "keyframed": True},
+        "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 241, "keyframed": True},
+        "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
+    },
+    {
+        "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
+        "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
+        "AvidParameterByteOrder": {"baked_sample_count": None, "keyframed": False},
+        "DVE_BORDER_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_PRSP_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_PRSP_X_U": {"baked_sample_count": 241, "keyframed": True},
+        "DVE_PRSP_Y_U": {"baked_sample_count": 241, "keyframed": True},
+        "DVE_PRSP_Z_U": {"baked_sample_count": 241, "keyframed": True},
+        "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
+        "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
+        "Vergence": {"baked_sample_count": 241, "keyframed": True},
+    },
+]
+
+
+# (index, effect type, time scalar, duration) of the linear clips in the misc
+# speed effects sample.
+_MISC_SPEED_EFFECTS = (
+    (0, None, None, 8),
+    (1, otio.schema.FreezeFrame, 0, 8),
+    (2, otio.schema.LinearTimeWarp, 2.0, 8),
+    (3, otio.schema.LinearTimeWarp, 0.5, 8),
+    (4, otio.schema.LinearTimeWarp, 3.0, 8),
+    (5, otio.schema.LinearTimeWarp, 0.3750, 8),
+    (6, otio.schema.LinearTimeWarp, 14.3750, 8),
+    (7, otio.schema.LinearTimeWarp, 0.3750, 8),
+    (8, otio.schema.LinearTimeWarp, -1.0, 8),
+)
+
+
+# OTIO track kind of each AAF slot media kind the writer produces
+_KIND_MAPPING = {
+    "picture": otio.schema.TrackKind.Video,
+    "sound": otio.schema.TrackKind.Audio,
+}
+
+
 try:
     lib_path = os.environ.get("OTIO_AAF_PYTHON_LIB")
     if lib_path and lib_path not in sys.path:
@@ -239,32 +574,69 @@ try:
     from aaf2.mobs import MasterMob, SourceMob
     from aaf2.misc import VaryingValue
     from aaf2.mobid import MobID
+
+    # AAF component written for each OTIO composable type
+    _TYPE_MAPPING = {
+        otio.schema.Clip: SourceClip,
+        otio.schema.Transition: Transition,
+        otio.schema.Gap: Filler,
+        otio.schema.Stack: OperationGroup,
+        otio.schema.Track: OperationGroup,
+    }
     could_import_aaf = True
 except (ImportError):
     could_import_aaf = False
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_read(path, **kwargs):
+    """Read ``path`` once per test session.
+
+    The returned timeline is shared by every caller with the same arguments,
+    so it must be treated as read-only: no edits to its items or metadata and
+    no transforms like ``flatten_stack`` or ``_simplify`` over it. Use
+    ``_read`` for a private copy whenever a test modifies or transforms the
+    timeline.
+    """
+    return otio.adapters.read_from_file(path, **kwargs)
+
+
+def _read(path, **kwargs):
+    """Return a private copy of the cached read of ``path``."""
+    return copy.deepcopy(_cached_read(path, **kwargs))
+
+
+def _target_url_fixup(timeline):
+    # fixes up relative paths to be absolute to this test file
+    for clip in timeline.find_clips():
+        target_url_str = clip.media_reference.target_url
+        clip.media_reference.target_url = os.path.join(TEST_DIR, target_url_str)
+
+
 @unittest.skipIf(
     not could_import_aaf,
     "AAF module not found. You might need to set OTIO_AAF_PYTHON_LIB"
 )
 class AAFReaderTests(unittest.TestCase):
+    maxDiff = None
 
     def test_aaf_read(self):
         aaf_path = SIMPLE_EXAMPLE_PATH
-        timeline = otio.adapters.read_from_file(aaf_path)
+        timeline = _cached_read(aaf_path)
         self.assertEqual(timeline.name, "OTIO TEST 1.Exported.01")
-        fps = timeline.duration().rate
+        duration = timeline.duration()
+        fps = duration.rate
         self.assertEqual(fps, 24.0)
         self.assertEqual(
-            timeline.duration(),
+            duration,
             otio.opentime.from_timecode("00:02:16:18", fps)
         )
 
         self.assertEqual(len(timeline.tracks), 3)
 
-        self.assertEqual(len(timeline.video_tracks()), 1)
-        video_track = timeline.video_tracks()[0]
+        video_tracks = timeline.video_tracks()
+        self.assertEqual(len(video_tracks), 1)
+        video_track = video_tracks[0]
         self.assertEqual(len(video_track), 5)
 
         self.assertEqual(len(timeline.audio_tracks()), 2)
@@ -281,42 +653,20 @@ class AAFReaderTests(unittest.TestCase):
             ],
             [clip.name for clip in clips]
         )
-        self.maxDiff = None
         self.assertEqual(
-            [clip.source_range for clip in clips],
-            [
-                otio.opentime.TimeRange(
-                    otio.opentime.from_timecode("01:00:00:00", fps),
-                    otio.opentime.from_timecode("00:00:30:00", fps)
-                ),
-                otio.opentime.TimeRange(
-                    otio.opentime.from_timecode("01:00:00:00", fps),
-                    otio.opentime.from_timecode("00:00:20:00", fps)
-                ),
-                otio.opentime.TimeRange(
-                    otio.opentime.from_timecode("01:00:00:00", fps),
-                    otio.opentime.from_timecode("00:00:30:02", fps)
-                ),
-                otio.opentime.TimeRange(
-                    otio.opentime.from_timecode("01:00:00:00", fps),
-                    otio.opentime.from_timecode("00:00:26:16", fps)
-                ),
-                otio.opentime.TimeRange(
-                    otio.opentime.from_timecode("01:00:00:00", fps),
-                    otio.opentime.from_timecode("00:00:30:00", fps)
-                )
-            ]
+            tuple(clip.source_range for clip in clips),
+            _SIMPLE_DESIRED_SOURCE_RANGES
         )
 
     def test_aaf_global_start_time(self):
-        timeline = otio.adapters.read_from_file(SIMPLE_EXAMPLE_PATH)
+        timeline = _cached_read(SIMPLE_EXAMPLE_PATH)
         self.assertEqual(
             otio.opentime.from_timecode("01:00:00:00", 24),
             timeline.global_start_time
         )
 
     def test_aaf_global_start_time_NTSC_DFTC(self):
-        timeline = otio.adapters.read_from_file(FPS2997_DFTC_PATH)
+        timeline = _cached_read(FPS2997_DFTC_PATH)
         self.assertEqual(
             otio.opentime.from_timecode("05:00:00;00", rate=(30000.0 / 1001)),
             timeline.global_start_time
@@ -324,21 +674,23 @@ class AAFReaderTests(unittest.TestCase):
 
     def test_aaf_read_trims(self):
         aaf_path = TRIMS_EXAMPLE_PATH
-        timeline = otio.adapters.read_from_file(aaf_path)
+        timeline = _cached_read(aaf_path)
         self.assertEqual(
             timeline.name,
             "OTIO TEST 1.Exported.01 - trims.Exported.02"
         )
-        fps = timeline.duration().rate
+        duration = timeline.duration()
+        fps = duration.rate
         self.assertEqual(fps, 24.0)
 
         video_tracks = timeline.video_tracks()
         self.assertEqual(len(video_tracks), 1)
         video_track = video_tracks[0]
-        self.assertEqual(len(video_track), 6)
+        items = list(video_track)
+        self.assertEqual(len(items), 6)
 
         self.assertEqual(
-            [type(item) for item in video_track],
+            [type(item) for item in items],
             [
                 otio.schema.Clip,
                 otio.schema.Clip,
@@ -352,7 +704,7 @@ class AAFReaderTests(unittest.TestCase):
         clips = video_track.find_clips()
 
         self.assertEqual(
-            [item.name for item in video_track],
+            [item.name for item in items],
             [
                 "tech.fux (loop)-HD.mp4",
                 "t-hawk (loop)-HD.mp4",
@@ -363,101 +715,40 @@ class AAFReaderTests(unittest.TestCase):
             ]
         )
 
-        self.maxDiff = None
-        desired_ranges = [
-            otio.opentime.TimeRange(
-                otio.opentime.from_frames(86400, fps),
-                otio.opentime.from_frames(720 - 0, fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_frames(86400 + 121, fps),
-                otio.opentime.from_frames(480 - 121, fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_frames(86400 + 123, fps),
-                otio.opentime.from_frames(523 - 123, fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_frames(0, fps),
-                otio.opentime.from_frames(559 - 0, fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_frames(86400 + 69, fps),
-                otio.opentime.from_frames(720 - 69, fps)
-            )
-        ]
-        for clip, desired in zip(clips, desired_ranges):
-            actual = clip.source_range
-            self.assertEqual(
-                actual,
-                desired,
-                "clip '{}' source_range should be {} not {}".format(
-                    clip.name,
-                    desired,
-                    actual
-                )
-            )
+        self.assertEqual(
+            tuple(clip.source_range for clip in clips),
+            _TRIMS_DESIRED_SOURCE_RANGES
+        )
 
-        desired_ranges = [
-            otio.opentime.TimeRange(
-                otio.opentime.from_timecode("00:00:00:00", fps),
-                otio.opentime.from_timecode("00:00:30:00", fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_timecode("00:00:30:00", fps),
-                otio.opentime.from_timecode("00:00:14:23", fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_timecode("00:00:44:23", fps),
-                otio.opentime.from_timecode("00:00:16:16", fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_timecode("00:01:01:15", fps),
-                otio.opentime.from_timecode("00:00:23:07", fps)
-            ),
-            otio.opentime.TimeRange(    # Gap
-                otio.opentime.from_timecode("00:01:24:22", fps),
-                otio.opentime.from_timecode("00:00:04:12", fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_timecode("00:01:29:10", fps),
-                otio.opentime.from_timecode("00:00:27:03", fps)
-            )
-        ]
-        for item, desired in zip(video_track, desired_ranges):
-            actual = item.trimmed_range_in_parent()
-            self.assertEqual(
-                actual,
-                desired,
-                "item '{}' trimmed_range_in_parent should be {} not {}".format(
-                    clip.name,
-                    desired,
-                    actual
-                )
-            )
+        self.assertEqual(
+            tuple(item.trimmed_range_in_parent() for item in items),
+            _TRIMS_DESIRED_RANGES_IN_PARENT
+        )
 
         self.assertEqual(
-            timeline.duration(),
+            duration,
             otio.opentime.from_timecode("00:01:56:13", fps)
         )
 
     def test_aaf_read_transitions(self):
         aaf_path = TRANSITIONS_EXAMPLE_PATH
-        timeline = otio.adapters.read_from_file(aaf_path)
+        timeline = _cached_read(aaf_path)
         self.assertEqual(timeline.name, "OTIO TEST - transitions.Exported.01")
-        fps = timeline.duration().rate
+        duration = timeline.duration()
+        fps = duration.rate
         self.assertEqual(fps, 24.0)
 
         video_tracks = timeline.video_tracks()
         self.assertEqual(len(video_tracks), 1)
         video_track = video_tracks[0]
-        self.assertEqual(len(video_track), 12)
+        items = list(video_track)
+        self.assertEqual(len(items), 12)
 
         clips = video_track.find_clips()
         self.assertEqual(len(clips), 4)
 
         self.assertEqual(
-            [type(item) for item in video_track],
+            [type(item) for item in items],
             [
                 otio.schema.Gap,
                 otio.schema.Transition,
@@ -475,7 +766,7 @@ class AAFReaderTests(unittest.TestCase):
         )
 
         self.assertEqual(
-            [item.name for item in video_track],
+            [item.name for item in items],
             [
                 "Filler",
                 "Transition",
@@ -492,107 +783,24 @@ class AAFReaderTests(unittest.TestCase):
             ]
         )
 
-        self.maxDiff = None
-        desired_ranges = [
-            otio.opentime.TimeRange(
-                otio.opentime.from_frames(86400 + 0, fps),
-                otio.opentime.from_frames(117, fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_frames(86400 + 123, fps),
-                otio.opentime.from_frames(200 - 123, fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_frames(55, fps),
-                otio.opentime.from_frames(199 - 55, fps)
-            ),
-            otio.opentime.TimeRange(
-                otio.opentime.from_frames(86400 + 0, fps),
-                otio.opentime.from_frames(130, fps)
-            )
-        ]
-        for clip, desired in zip(clips, desired_ranges):
-            actual = clip.source_range
-            self.assertEqual(
-                actual,
-                desired,
-                "clip '{}' source_range should be {} not {}".format(
-                    clip.name,
-                    desired,
-                    actual
-                )
-            )
+        self.assertEqual(
+            tuple(clip.source_range for clip in clips),
+            _TRANSITIONS_DESIRED_SOURCE_RANGES
+        )
 
-        desired_ranges = [
-            otio.opentime.TimeRange(    # Gap
-                otio.opentime.from_timecode("00:00:00:00", fps),
-                otio.opentime.from_timecode("00:00:00:00", fps)
-            ),
-            otio.opentime.TimeRange(    # Transition
-                otio.opentime.from_timecode("00:00:00:00", fps),
-                otio.opentime.from_timecode("00:00:00:12", fps)
-            ),
-            otio.opentime.TimeRange(    # tech.fux
-                otio.opentime.from_timecode("00:00:00:00", fps),
-                otio.opentime.from_timecode("00:00:04:21", fps)
-            ),
-            otio.opentime.TimeRange(    # Transition
-                otio.opentime.from_timecode("00:00:02:21", fps),
-                otio.opentime.from_timecode("00:00:02:00", fps)
-            ),
-            otio.opentime.TimeRange(    # t-hawk
-                otio.opentime.from_timecode("00:00:04:21", fps),
-                otio.opentime.from_timecode("00:00:03:05", fps)
-            ),
-            otio.opentime.TimeRange(    # Transition
-                otio.opentime.from_timecode("00:00:07:14", fps),
-                otio.opentime.from_timecode("00:00:01:00", fps)
-            ),
-            otio.opentime.TimeRange(    # Gap
-                otio.opentime.from_timecode("00:00:08:02", fps),
-                otio.opentime.from_timecode("00:00:02:05", fps)
-            ),
-            otio.opentime.TimeRange(    # Transition
-                otio.opentime.from_timecode("00:00:09:07", fps),
-                otio.opentime.from_timecode("00:00:02:00", fps)
-            ),
-            otio.opentime.TimeRange(    # KOLL-HD
-                otio.opentime.from_timecode("00:00:10:07", fps),
-                otio.opentime.from_timecode("00:00:06:00", fps)
-            ),
-            otio.opentime.TimeRange(    # brokchrd
-                otio.opentime.from_timecode("00:00:16:07", fps),
-                otio.opentime.from_timecode("00:00:05:10", fps)
-            ),
-            otio.opentime.TimeRange(    # Transition
-                otio.opentime.from_timecode("00:00:19:17", fps),
-                otio.opentime.from_timecode("00:00:02:00", fps)
-            ),
-            otio.opentime.TimeRange(    # Gap
-                otio.opentime.from_timecode("00:00:21:17", fps),
-                otio.opentime.from_timecode("00:00:00:00", fps)
-            )
-        ]
-        for item, desired in zip(video_track, desired_ranges):
-            actual = item.trimmed_range_in_parent()
-            self.assertEqual(
-                desired,
-                actual,
-                "item '{}' trimmed_range_in_parent should be {} not {}".format(
-                    clip.name,
-                    desired,
-                    actual
-                )
-            )
+        self.assertEqual(
+            tuple(item.trimmed_range_in_parent() for item in items),
+            _TRANSITIONS_DESIRED_RANGES_IN_PARENT
+        )
 
         self.assertEqual(
-            timeline.duration(),
+            duration,
             otio.opentime.from_timecode("00:00:21:17", fps)
         )
 
     def test_timecode(self):
         aaf_path = TIMCODE_EXAMPLE_PATH
-        timeline = otio.adapters.read_from_file(aaf_path)
+        timeline = _cached_read(aaf_path)
         self.assertNotEqual(
             timeline.tracks[0][0].source_range.start_time,
             timeline.tracks[0][1].source_range.start_time
@@ -604,7 +812,7 @@ class AAFReaderTests(unittest.TestCase):
 
     def test_aaf_user_comments(self):
         aaf_path = TRIMS_EXAMPLE_PATH
-        timeline = otio.adapters.read_from_file(aaf_path)
+        timeline = _cached_read(aaf_path)
         self.assertIsNotNone(timeline)
         self.assertEqual(type(timeline), otio.schema.Timeline)
         self.assertIsNotNone(timeline.metadata.get("AAF"))
@@ -621,70 +829,12 @@ class AAFReaderTests(unittest.TestCase):
                 continue
             AAFmetadata = clip.media_reference.metadata.get("AAF")
             self.assertIsNotNone(AAFmetadata)
-            self.assertIsNotNone(AAFmetadata.get("UserComments"))
-            self.assertEqual(
-                AAFmetadata.get("UserComments").get("CustomTest"),
-                correctWord
-            )
-
-    def test_aaf_flatten_tracks(self):
-        multitrack_timeline = otio.adapters.read_from_file(
-            MULTITRACK_EXAMPLE_PATH, attach_markers=False
-        )
-        preflattened_timeline = otio.adapters.read_from_file(
-            PREFLATTENED_EXAMPLE_PATH, attach_markers=False
-        )
-
-        # first make sure we got the structure we expected
-        self.assertEqual(3, len(preflattened_timeline.tracks))
-        self.assertEqual(1, len(preflattened_timeline.video_tracks()))
-        self.assertEqual(2, len(preflattened_timeline.audio_tracks()))
-
-        self.assertEqual(3, len(multitrack_timeline.video_tracks()))
-        self.assertEqual(2, len(multitrack_timeline.audio_tracks()))
-        self.assertEqual(8, len(multitrack_timeline.tracks))
-
-        preflattened = preflattened_timeline.video_tracks()[0]
-        self.assertEqual(7, len(preflattened))
-        flattened = otio.algorithms.flatten_stack(
-            multitrack_timeline.video_tracks()
-        )
-        self.assertEqual(7, len(flattened))
-
-        # Lets remove some AAF metadata that will always be different
-        # so we can compare everything else.
-        for t in (preflattened, flattened):
-
-            t.name = ""
-            t.metadata.pop("AAF", None)
-
-            for c in t.find_children():
-                if hasattr(c, "media_reference") and c.media_reference:
-                    mr = c.media_reference
-                    mr.metadata.get("AAF", {}).pop('LastModified', None)
-                meta = c.metadata.get("AAF", {})
-                meta.pop('ComponentAttributeList', None)
-                meta.pop('DataDefinition', None)
-                meta.pop('Length', None)
-                meta.pop('StartTime', None)
-
-            # We don't care about Gap start times, only their duration matters
-            for g in t.find_children(descended_from_type=otio.schema.Gap):
-                dur = g.source_range.duration
-                rate = g.source_range.start_time.rate
-                g.source_range = otio.opentime.TimeRange(
-                    otio.opentime.RationalTime(0, rate),
-                    dur
-                )
-
-        self.maxDiff = None
-        self.assertMultiLineEqual(
-            otio.adapters.write_to_string(preflattened, "otio_json"),
-            otio.adapters.write_to_string(flattened, "otio_json")
-        )
+            user_comments = AAFmetadata.get("UserComments")
+            self.assertIsNotNone(user_comments)
+            self.assertEqual(user_comments.get("CustomTest"), correctWord)
 
     def test_aaf_nesting(self):
-        timeline = otio.adapters.read_from_file(NESTING_EXAMPLE_PATH)
+        timeline = _cached_read(NESTING_EXAMPLE_PATH)
         self.assertEqual(1, len(timeline.tracks))
         track = timeline.tracks[0]
         self.assertEqual(3, len(track))
@@ -700,41 +850,19 @@ class AAFReaderTests(unittest.TestCase):
         self.assertEqual(otio.schema.Clip, type(nestedClipB))
 
         self.assertEqual(
-            otio.opentime.TimeRange(
-                start_time=otio.opentime.RationalTime(24, 24),
-                duration=otio.opentime.RationalTime(16, 24)
-            ),
-            clipA.trimmed_range()
-        )
-        self.assertEqual(
-            otio.opentime.TimeRange(
-                start_time=otio.opentime.RationalTime(86400 + 32, 24),
-                duration=otio.opentime.RationalTime(16, 24)
-            ),
-            clipB.trimmed_range()
-        )
-
-        self.assertEqual(
-            otio.opentime.TimeRange(
-                start_time=otio.opentime.RationalTime(40, 24),
-                duration=otio.opentime.RationalTime(8, 24)
-            ),
-            nestedClipA.trimmed_range()
-        )
-        self.assertEqual(
-            otio.opentime.TimeRange(
-                start_time=otio.opentime.RationalTime(86400 + 24, 24),
-                duration=otio.opentime.RationalTime(8, 24)
-            ),
-            nestedClipB.trimmed_range()
+            _NESTING_DESIRED_TRIMMED_RANGES,
+            tuple(
+                item.trimmed_range()
+                for item in (clipA, clipB, nestedClipA, nestedClipB)
+            )
         )
 
     # TODO: This belongs in the algorithms tests, not the AAF tests.
     def SKIP_test_nesting_flatten(self):
-        nested_timeline = otio.adapters.read_from_file(
+        nested_timeline = _read(
             NESTING_EXAMPLE_PATH
         )
-        preflattened_timeline = otio.adapters.read_from_file(
+        preflattened_timeline = _read(
             NESTING_PREFLATTENED_EXAMPLE_PATH
         )
         flattened_track = otio.algorithms.flatten_stack(nested_timeline.tracks)
@@ -744,7 +872,7 @@ class AAFReaderTests(unittest.TestCase):
         )
 
     def test_read_linear_speed_effects(self):
-        timeline = otio.adapters.read_from_file(
+        timeline = _cached_read(
             LINEAR_SPEED_EFFECTS_EXAMPLE_PATH
         )
         self.assertEqual(1, len(timeline.tracks))
@@ -754,11 +882,14 @@ class AAFReaderTests(unittest.TestCase):
         clip = track[0]
         self.assertEqual(0, len(clip.effects))
 
-        for clip in track[1:]:
-            self.assertIsInstance(clip, otio.schema.Clip)
-            self.assertEqual(1, len(clip.effects))
-            effect = clip.effects[0]
-            self.assertEqual(otio.schema.LinearTimeWarp, type(effect))
+        speed_clips = track[1:]
+        self.assertEqual(
+            [(otio.schema.Clip, [otio.schema.LinearTimeWarp])] * 19,
+            [
+                (type(clip), [type(effect) for effect in clip.effects])
+                for clip in speed_clips
+            ]
+        )
 
         expected = [
             50.00,   # 2/1
@@ -782,88 +913,40 @@ class AAFReaderTests(unittest.TestCase):
             125.00   # 4/5
         ]
         actual = [
-            round(clip.effects[0].time_scalar * 100.0, 2) for clip in track[1:]
+            round(clip.effects[0].time_scalar * 100.0, 2) for clip in speed_clips
         ]
         self.assertEqual(expected, actual)
 
     def test_read_misc_speed_effects(self):
-        timeline = otio.adapters.read_from_file(
+        timeline = _cached_read(
             MISC_SPEED_EFFECTS_EXAMPLE_PATH
         )
         self.assertEqual(1, len(timeline.tracks))
         track = timeline.tracks[0]
         self.assertEqual(10, len(track))
 
-        clip = track[0]
-        self.assertEqual(0, len(clip.effects))
-        self.assertEqual(8, clip.duration().value)
-
-        clip = track[1]
-        self.assertEqual(1, len(clip.effects))
-        effect = clip.effects[0]
-        self.assertEqual(otio.schema.FreezeFrame, type(effect))
-        self.assertEqual(0, effect.time_scalar)
-        self.assertEqual(8, clip.duration().value)
-
-        clip = track[2]
-        self.assertEqual(1, len(clip.effects))
-        effect = clip.effects[0]
-        self.assertEqual(otio.schema.LinearTimeWarp, type(effect))
-        self.assertEqual(2.0, effect.time_scalar)
-        self.assertEqual(8, clip.duration().value)
-
-        clip = track[3]
-        self.assertEqual(1, len(clip.effects))
-        effect = clip.effects[0]
-        self.assertEqual(otio.schema.LinearTimeWarp, type(effect))
-        self.assertEqual(0.5, effect.time_scalar)
-        self.assertEqual(8, clip.duration().value)
-
-        clip = track[4]
-        self.assertEqual(1, len(clip.effects))
-        effect = clip.effects[0]
-        self.assertEqual(otio.schema.LinearTimeWarp, type(effect))
-        self.assertEqual(3.0, effect.time_scalar)
-        self.assertEqual(8, clip.duration().value)
-
-        clip = track[5]
-        self.assertEqual(1, len(clip.effects))
-        effect = clip.effects[0]
-        self.assertEqual(otio.schema.LinearTimeWarp, type(effect))
-        self.assertEqual(0.3750, effect.time_scalar)
-        self.assertEqual(8, clip.duration().value)
-
-        clip = track[6]
-        self.assertEqual(1, len(clip.effects))
-        effect = clip.effects[0]
-        self.assertEqual(otio.schema.LinearTimeWarp, type(effect))
-        self.assertEqual(14.3750, effect.time_scalar)
-        self.assertEqual(8, clip.duration().value)
-
-        clip = track[7]
-        self.assertEqual(1, len(clip.effects))
-        effect = clip.effects[0]
-        self.assertEqual(otio.schema.LinearTimeWarp, type(effect))
-        self.assertEqual(0.3750, effect.time_scalar)
-        self.assertEqual(8, clip.duration().value)
-
-        clip = track[8]
-        self.assertEqual(1, len(clip.effects))
-        effect = clip.effects[0]
-        self.assertEqual(otio.schema.LinearTimeWarp, type(effect))
-        self.assertEqual(-1.0, effect.time_scalar)
-        self.assertEqual(8, clip.duration().value)
+        for index, effect_type, time_scalar, duration in _MISC_SPEED_EFFECTS:
+            with self.subTest(index=index):
+                clip = track[index]
+                self.assertEqual(duration, clip.duration().value)
+                if effect_type is None:
+                    self.assertEqual(0, len(clip.effects))
+                    continue
+                self.assertEqual(1, len(clip.effects))
+                effect = clip.effects[0]
+                self.assertEqual(effect_type, type(effect))
+                self.assertEqual(time_scalar, effect.time_scalar)
 
         clip = track[9]
         self.assertEqual(1, len(clip.effects))
         effect = clip.effects[0]
-        self.assertTrue(isinstance(effect, otio.schema.TimeEffect))
+        self.assertIsInstance(effect, otio.schema.TimeEffect)
         self.assertEqual(16, clip.duration().value)
         # TODO: We don't yet support non-linear time warps, but when we
         # do then this effect is a "Speed Bump" from 166% to 44% to 166%
 
     def test_muted_clip(self):
-        timeline = otio.adapters.read_from_file(MUTED_CLIP_PATH)
+        timeline = _cached_read(MUTED_CLIP_PATH)
         self.assertIsInstance(timeline, otio.schema.Timeline)
         self.assertEqual(len(timeline.tracks), 1)
         track = timeline.tracks[0]
@@ -874,7 +957,7 @@ class AAFReaderTests(unittest.TestCase):
         self.assertEqual(clip.enabled, False)
 
     def test_essence_group(self):
-        timeline = otio.adapters.read_from_file(ESSENCE_GROUP_PATH)
+        timeline = _cached_read(ESSENCE_GROUP_PATH)
 
         self.assertIsNotNone(timeline)
         self.assertEqual(
@@ -883,15 +966,15 @@ class AAFReaderTests(unittest.TestCase):
         )
 
     def test_30fps(self):
-        tl = otio.adapters.read_from_file(FPS30_CLIP_PATH)
+        tl = _cached_read(FPS30_CLIP_PATH)
         self.assertEqual(tl.duration().rate, 30)
 
     def test_2997fps(self):
-        tl = otio.adapters.read_from_file(FPS2997_CLIP_PATH)
+        tl = _cached_read(FPS2997_CLIP_PATH)
         self.assertEqual(tl.duration().rate, 30000 / 1001.0)
 
     def test_utf8_names(self):
-        timeline = otio.adapters.read_from_file(UTF8_CLIP_PATH)
+        timeline = _cached_read(UTF8_CLIP_PATH)
         self.assertEqual(
             ("Sequence_ABCXYZñçêœ•∑´®†¥¨ˆøπ“‘åß∂ƒ©˙∆˚¬…æΩ≈ç√∫˜µ≤≥÷.Exported.01"),
             timeline.name
@@ -903,19 +986,17 @@ class AAFReaderTests(unittest.TestCase):
             ("Clip_ABCXYZñçêœ•∑´®†¥¨ˆøπ“‘åß∂ƒ©˙∆˚¬…æΩ≈ç√∫˜µ≤≥÷")
         )
         self.assertEqual(
-            (
-                first_clip.media_reference.metadata["AAF"]["UserComments"]["Comments"]
-            ).encode('utf-8'),
-            ("Comments_ABCXYZñçêœ•∑´®†¥¨ˆøπ“‘åß∂ƒ©˙∆˚¬…æΩ≈ç√∫˜µ≤≥÷").encode()
+            first_clip.media_reference.metadata["AAF"]["UserComments"]["Comments"],
+            "Comments_ABCXYZñçêœ•∑´®†¥¨ˆøπ“‘åß∂ƒ©˙∆˚¬…æΩ≈ç√∫˜µ≤≥÷"
         )
 
     def test_multiple_top_level_mobs(self):
-        result = otio.adapters.read_from_file(MULTIPLE_TOP_LEVEL_MOBS_CLIP_PATH)
+        result = _cached_read(MULTIPLE_TOP_LEVEL_MOBS_CLIP_PATH)
         self.assertIsInstance(result, otio.schema.SerializableCollection)
         self.assertEqual(2, len(result))
 
     def test_external_reference_from_unc_path(self):
-        timeline = otio.adapters.read_from_file(SIMPLE_EXAMPLE_PATH)
+        timeline = _cached_read(SIMPLE_EXAMPLE_PATH)
         video_track = timeline.video_tracks()[0]
         first_clip = video_track[0]
         self.assertIsInstance(first_clip.media_reference,
@@ -931,7 +1012,7 @@ class AAFReaderTests(unittest.TestCase):
         )
 
     def test_external_reference_paths(self):
-        timeline = otio.adapters.read_from_file(COMPOSITE_PATH)
+        timeline = _cached_read(COMPOSITE_PATH)
         video_target_urls = [
             [
                 "file:////animation/root/work/editorial/jburnell/700/1.aaf",
@@ -948,19 +1029,17 @@ class AAFReaderTests(unittest.TestCase):
             ]
         ]
 
-        for track_index, video_track in enumerate(timeline.video_tracks()):
-            for clip_index, clip in enumerate(video_track):
-                self.assertIsInstance(clip.media_reference,
-                                      otio.schema.ExternalReference)
-                self.assertEqual(clip.media_reference.target_url,
-                                 video_target_urls[track_index][clip_index])
+        chain = itertools.chain.from_iterable
+        expected_urls = list(chain(video_target_urls + audio_target_urls))
+        clips = list(
+            chain(timeline.video_tracks() + timeline.audio_tracks())
+        )
+        self.assertEqual(len(expected_urls), len(clips))
 
-        for track_index, audio_track in enumerate(timeline.audio_tracks()):
-            for clip_index, clip in enumerate(audio_track):
-                self.assertIsInstance(clip.media_reference,
-                                      otio.schema.ExternalReference)
-                self.assertEqual(clip.media_reference.target_url,
-                                 audio_target_urls[track_index][clip_index])
+        for clip, target_url in zip(clips, expected_urls):
+            self.assertIsInstance(clip.media_reference,
+                                  otio.schema.ExternalReference)
+            self.assertEqual(clip.media_reference.target_url, target_url)
 
     def test_aaf_subclip_metadata(self):
         """
@@ -970,7 +1049,7 @@ class AAFReaderTests(unittest.TestCase):
         to find the MasterMob with the UserComments.
         """
 
-        timeline = otio.adapters.read_from_file(SUBCLIP_PATH)
+        timeline = _cached_read(SUBCLIP_PATH)
         audio_track = timeline.audio_tracks()[0]
         first_clip = audio_track[0]
 
@@ -990,16 +1069,18 @@ class AAFReaderTests(unittest.TestCase):
         For sub-clips this value should be `Usage_SubClip`.
         """
         # `Usage_SubClip` value
-        subclip_timeline = otio.adapters.read_from_file(SUBCLIP_PATH)
+        subclip_timeline = _cached_read(SUBCLIP_PATH)
         subclip_usages = {"Subclip.BREATH": "Usage_SubClip"}
-        for clip in subclip_timeline.find_clips():
-            self.assertEqual(
-                clip.metadata.get("AAF", {}).get("SourceMobUsage"),
-                subclip_usages[clip.name]
-            )
+        self.assertEqual(
+            {
+                clip.name: (clip.metadata.get("AAF") or {}).get("SourceMobUsage")
+                for clip in subclip_timeline.find_clips()
+            },
+            subclip_usages
+        )
 
         # no usage value
-        simple_timeline = otio.adapters.read_from_file(SIMPLE_EXAMPLE_PATH)
+        simple_timeline = _cached_read(SIMPLE_EXAMPLE_PATH)
         simple_usages = {
             "KOLL-HD.mp4": "",
             "brokchrd (loop)-HD.mp4": "",
@@ -1007,11 +1088,13 @@ class AAFReaderTests(unittest.TestCase):
             "t-hawk (loop)-HD.mp4": "",
             "tech.fux (loop)-HD.mp4": ""
         }
-        for clip in simple_timeline.find_clips():
-            self.assertEqual(
-                clip.metadata.get("AAF", {}).get("SourceMobUsage", ""),
-                simple_usages[clip.name]
-            )
+        self.assertEqual(
+            {
+                clip.name: (clip.metadata.get("AAF") or {}).get("SourceMobUsage", "")
+                for clip in simple_timeline.find_clips()
+            },
+            simple_usages
+        )
 
     def test_aaf_composition_metadata(self):
         """
@@ -1022,7 +1105,7 @@ class AAFReaderTests(unittest.TestCase):
         between different SourceClips
         """
 
-        timeline = otio.adapters.read_from_file(COMPOSITION_METADATA_PATH)
+        timeline = _cached_read(COMPOSITION_METADATA_PATH)
 
         audio_track = timeline.audio_tracks()[0]
         first_clip = audio_track[0]
@@ -1045,7 +1128,7 @@ class AAFReaderTests(unittest.TestCase):
         In this case the masterMob has the valid UserComments (empirically determined)
         """
 
-        timeline = otio.adapters.read_from_file(
+        timeline = _cached_read(
             COMPOSITION_METADATA_MASTERMOB_METADATA_PATH)
 
         audio_track = timeline.audio_tracks()[0]
@@ -1067,7 +1150,7 @@ class AAFReaderTests(unittest.TestCase):
         same start value and length.
         """
 
-        timeline = otio.adapters.read_from_file(
+        timeline = _cached_read(
             MULTIPLE_TIMECODE_OBJECTS_PATH)
 
         self.assertIsNotNone(timeline)
@@ -1084,42 +1167,71 @@ class AAFReaderTests(unittest.TestCase):
         """Excercise an aaf-adapter read with transcribe_logging enabled."""
 
         # capture output of debugging statements
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-
-        sys.stdout = io.StringIO()
-        sys.stderr = io.StringIO()
-        otio.adapters.read_from_file(SUBCLIP_PATH, transcribe_log=True)
-        result_stdout = sys.stdout.getvalue()
-        result_stderr = sys.stderr.getvalue()
-
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            otio.adapters.read_from_file(SUBCLIP_PATH, transcribe_log=True)
+        result_stdout = stdout.getvalue()
+        result_stderr = stderr.getvalue()
 
         # conform python 2 and 3 behavior
         result_stdout = result_stdout.replace("b'", "").replace("'", "")
 
-        self.assertEqual(result_stdout, TRANSCRIPTION_RESULT)
+        with open(EXPECTED_TRANSCRIPTION_TXT_PATH, 'r') as f:
+            expected_stdout = f.read()
+
+        self.assertEqual(result_stdout.splitlines(), expected_stdout.splitlines())
         self.assertEqual(result_stderr, '')
 
-    def test_aaf_marker_over_transition(self):
+    def test_aaf_transcribe_log_reused_mastermob(self):
+        """A MasterMob shared by several clips is transcribed once and then
+        logged as reused.
         """
-        Make sure we can transcibe this composition with markers over transition.
-        """
-
-        timeline = None
-
-        try:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
             timeline = otio.adapters.read_from_file(
-                MARKER_OVER_TRANSITION_PATH
+                SIMPLE_EXAMPLE_PATH, transcribe_log=True
             )
+        log_lines = [line.strip() for line in stdout.getvalue().splitlines()]
 
-        except Exception as e:
-            print('[ERROR] Transcribing test sample data `{}` caused an exception: {}'.format(  # noqa
-                os.path.basename(MARKER_OVER_TRANSITION_PATH),
-                e)
+        mob_ids = collections.Counter(
+            clip.media_reference.metadata["AAF"]["MobID"]
+            for clip in timeline.find_clips()
+        )
+        shared = {mob_id: n for mob_id, n in mob_ids.items() if n > 1}
+        self.assertTrue(shared)
+        for mob_id, n in shared.items():
+            self.assertEqual(
+                n - 1,
+                log_lines.count(f"[reusing transcribed MasterMob {mob_id}]")
             )
 
+    def test_aaf_shared_mastermob_metadata_is_independent(self):
+        # The read mutates the clips below, so don't use the cached timeline.
+        timeline = otio.adapters.read_from_file(SIMPLE_EXAMPLE_PATH)
+
+        clips_by_mob = collections.defaultdict(list)
+        for clip in timeline.find_clips():
+            mob_id = clip.media_reference.metadata["AAF"]["MobID"]
+            clips_by_mob[mob_id].append(clip)
+
+        shared = [clips for clips in clips_by_mob.values() if len(clips) > 1]
+        self.assertTrue(shared)
+        for first, *others in shared:
+            first_metadata = first.media_reference.metadata["AAF"]
+            first_metadata["UserComments"]["Test"] = "changed"
+            first_metadata["Name"] = "changed"
+            for other in others:
+                other_metadata = other.media_reference.metadata["AAF"]
+                self.assertNotIn("Test", other_metadata["UserComments"])
+                self.assertNotEqual("changed", other_metadata["Name"])
+
+    def test_aaf_marker_over_transition(self):
+        """
+        Make sure we can transcibe this composition with markers over transition.
+        """
+
+        timeline = _cached_read(MARKER_OVER_TRANSITION_PATH)
         self.assertIsNotNone(timeline)
 
     def test_multiple_markers_and_transitions(self):
@@ -1127,27 +1239,14 @@ class AAFReaderTests(unittest.TestCase):
         Make sure we can transcibe this composition with markers and transitions and
         timing is correct
         """
-        timeline = None
-
-        try:
-            timeline = otio.adapters.read_from_file(
-                MULTIPLE_MARKER_OVER_TRANSITION_PATH
-            )
-
-        except Exception as e:
-            print('[ERROR] Transcribing test sample data `{}` caused an exception: {}'.format(  # noqa
-                os.path.basename(MULTIPLE_MARKER_OVER_TRANSITION_PATH),
-                e)
-            )
-
+        timeline = _cached_read(MULTIPLE_MARKER_OVER_TRANSITION_PATH)
         self.assertIsNotNone(timeline)
 
         # read the markers.txt exported from Media Composer
-        marker_postions = []
         with open(MULTIPLE_MARKER_OVER_TRANSITION_TXT_PATH, 'r') as f:
-            for line in f.readlines():
-                s = line.split()
-                marker_postions.append([int(s[1]), int(s[4])])
+            marker_positions = [
+                (int(s[1]), int(s[4])) for s in (line.split(None, 5) for line in f)
+            ]
 
         index = 0
         transition = None
@@ -1161,24 +1260,28 @@ class AAFReaderTests(unittest.TestCase):
                 if not hasattr(item, 'markers'):
                     continue
 
+                markers = item.markers
+                if not markers:
+                    transition = None
+                    continue
+
                 start_frame = item.range_in_parent().start_time.to_frames()
                 source_start_frame = item.source_range.start_time.to_frames()
                 transition_offset = 0
                 if transition:
                     transition_offset = transition.in_offset.to_frames()
 
-                for marker in item.markers:
-                    absolute_frame, relative_frame = marker_postions[index]
-                    self.assertTrue(relative_frame == int(marker.name))
+                for marker in markers:
+                    absolute_frame, relative_frame = marker_positions[index]
+                    self.assertEqual(relative_frame, int(marker.name))
                     # NOTE: relative_frame from markers.txt includes frames
                     # needed from a prevous transition
-                    marker_frame = (
-                        marker.marked_range.start_time.to_frames() - source_start_frame
+                    marker_start = marker.marked_range.start_time
+                    marker_frame = marker_start.to_frames() - source_start_frame
+                    self.assertEqual(
+                        relative_frame, marker_frame + transition_offset
                     )
-                    self.assertTrue(
-                        relative_frame == (marker_frame + transition_offset)
-                    )
-                    self.assertTrue(absolute_frame == (marker_frame + start_frame))
+                    self.assertEqual(absolute_frame, marker_frame + start_frame)
                     index += 1
 
                 transition = None
@@ -1188,24 +1291,12 @@ class AAFReaderTests(unittest.TestCase):
         Make sure we can transcibe markers over an audio AAF file.
         """
 
-        timeline = None
-
-        try:
-            timeline = otio.adapters.read_from_file(
-                MARKER_OVER_AUDIO_PATH
-            )
-
-        except Exception as e:
-            print('[ERROR] Transcribing test sample data `{}` caused an exception: {}'.format(  # noqa
-                os.path.basename(MARKER_OVER_AUDIO_PATH),
-                e)
-            )
-
+        timeline = _cached_read(MARKER_OVER_AUDIO_PATH)
         self.assertIsNotNone(timeline)
 
         # Verify markers
         # We expect 1 track with 3 markers on it from the test data.
-        self.assertTrue(1 == len(timeline.tracks))
+        self.assertEqual(1, len(timeline.tracks))
 
         track = timeline.tracks[0]
         self.assertEqual(3, len(track.markers))
@@ -1249,35 +1340,11 @@ class AAFReaderTests(unittest.TestCase):
         This test confirms that we don't crash when reading such a file.
         """
 
-        timeline = None
-
-        try:
-            timeline = otio.adapters.read_from_file(
-                BAD_TRACK_NUMBER_ON_MARKER_PATH
-            )
-
-        except Exception as e:
-            print('[ERROR] Transcribing test sample data `{}` caused an exception: {}'.format(  # noqa
-                os.path.basename(BAD_TRACK_NUMBER_ON_MARKER_PATH),
-                e)
-            )
-
+        timeline = _cached_read(BAD_TRACK_NUMBER_ON_MARKER_PATH)
         self.assertIsNotNone(timeline)
 
     def test_aaf_nested_audio_dissolve(self):
-        timeline = None
-
-        try:
-            timeline = otio.adapters.read_from_file(
-                NESTED_AUDIO_DISSOLVE_PATH
-            )
-
-        except Exception as e:
-            print('[ERROR] Transcribing test sample data `{}` caused an exception: {}'.format(  # noqa
-                os.path.basename(NESTED_AUDIO_DISSOLVE_PATH),
-                e)
-            )
-
+        timeline = _cached_read(NESTED_AUDIO_DISSOLVE_PATH)
         self.assertIsNotNone(timeline)
         track = timeline.tracks[0]
 
@@ -1297,21 +1364,21 @@ class AAFReaderTests(unittest.TestCase):
 
     def _verify_user_comments(self, aaf_metadata, expected_md):
 
-        self.assertTrue(aaf_metadata is not None)
-        self.assertTrue("UserComments" in aaf_metadata.keys())
+        self.assertIsNotNone(aaf_metadata)
+        self.assertIn("UserComments", aaf_metadata)
 
         user_comments = aaf_metadata['UserComments']
 
-        user_comment_keys = user_comments.keys()
-        for k, v in expected_md.items():
-            self.assertTrue(k in user_comment_keys)
-            self.assertEqual(user_comments[k], v)
+        # a missing key shows up as a None value in the dict diff
+        self.assertEqual(
+            {k: user_comments.get(k) for k in expected_md},
+            expected_md
+        )
 
     def test_attach_markers(self):
         """Check if markers are correctly translated and attached to the right items.
         """
-        timeline = otio.adapters.read_from_file(MULTIPLE_MARKERS_PATH,
-                                                attach_markers=True)
+        timeline = _cached_read(MULTIPLE_MARKERS_PATH, attach_markers=True)
 
         expected_markers = {
             (1, 'Filler'): [('PUBLISH', 0.0, 1.0, 24.0, 'RED')],
@@ -1347,7 +1414,9 @@ class AAFReaderTests(unittest.TestCase):
                 timeline.find_children(descended_from_type=otio.schema.Track)
         ):
             for item in track.find_children():
-                markers = [
+                if not item.markers:
+                    continue
+                all_markers[(i, item.name)] = [
                     (
                         m.name,
                         m.marked_range.start_time.value,
@@ -1356,8 +1425,6 @@ class AAFReaderTests(unittest.TestCase):
                         m.color
                     ) for m in item.markers
                 ]
-                if markers:
-                    all_markers[(i, item.name)] = markers
         self.assertEqual(all_markers, expected_markers)
 
     def test_keyframed_properties(self):
@@ -1368,337 +1435,123 @@ class AAFReaderTests(unittest.TestCase):
                     props = {}
                     parameters = effect.metadata.get("AAF", {}).get("Parameters", {})
                     for paramName, paramValue in parameters.items():
-                        try:
+                        is_animated = False
+                        baked_count = None
+                        if isinstance(paramValue, collections.abc.Mapping):
                             is_animated = "_aaf_keyframed_property" in paramValue
-                        except (TypeError, KeyError):
-                            is_animated = False
-                        try:
-                            baked_count = len(paramValue["keyframe_baked_values"])
-                        except (TypeError, KeyError):
-                            baked_count = None
+                            baked = paramValue.get("keyframe_baked_values")
+                            if baked is not None:
+                                baked_count = len(baked)
                         props[paramName] = {"keyframed": is_animated,
                                             "baked_sample_count": baked_count}
                     expected.append(props)
             return expected
 
-        tl_unbaked = otio.adapters.read_from_file(KEYFRAMED_PROPERTIES_PATH,
-                                                  bake_keyframed_properties=False)
+        tl_unbaked = _cached_read(KEYFRAMED_PROPERTIES_PATH,
+                                  bake_keyframed_properties=False)
 
-        tl_baked = otio.adapters.read_from_file(KEYFRAMED_PROPERTIES_PATH,
-                                                bake_keyframed_properties=True)
+        tl_baked = _cached_read(KEYFRAMED_PROPERTIES_PATH,
+                                bake_keyframed_properties=True)
 
-        expected_unbaked = [
-            {
-                "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
-                "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
-                "AvidParameterByteOrder": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "DVE_BORDER_ENABLED_U": {"baked_sample_count": None,
-                                         "keyframed": False},
-                "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None,
-                                             "keyframed": False},
-                "DVE_SCALE_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_SCALE_X_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_SCALE_Y_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
-                "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
-                "AvidParameterByteOrder": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "DVE_BORDER_ENABLED_U": {"baked_sample_count": None,
-                                         "keyframed": False},
-                "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None,
-                                             "keyframed": False},
-                "DVE_ROT_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_ROT_X_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_ROT_Y_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_ROT_Z_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
-                "Vergence": {"baked_sample_count": None, "keyframed": True},
-            },
-            {
-                "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
-                "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
-                "AvidParameterByteOrder": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "DVE_BORDER_ENABLED_U": {"baked_sample_count": None,
-                                         "keyframed": False},
-                "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None,
-                                             "keyframed": False},
-                "DVE_POS_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_POS_X_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_POS_Y_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_POS_Z_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
-                "Vergence": {"baked_sample_count": None, "keyframed": True},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": None, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": None,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
-                "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
-                "AvidParameterByteOrder": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "DVE_BORDER_ENABLED_U": {"baked_sample_count": None,
-                                         "keyframed": False},
-                "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None,
-                                             "keyframed": False},
-                "DVE_PRSP_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_PRSP_X_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_PRSP_Y_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_PRSP_Z_U": {"baked_sample_count": None, "keyframed": True},
-                "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
-                "Vergence": {"baked_sample_count": None, "keyframed": True},
-            },
-        ]
-
-        expected_baked = [
-            {
-                "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
-                "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
-                "AvidParameterByteOrder": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "DVE_BORDER_ENABLED_U": {"baked_sample_count": None,
-                                         "keyframed": False},
-                "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None,
-                                             "keyframed": False},
-                "DVE_SCALE_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_SCALE_X_U": {"baked_sample_count": 212, "keyframed": True},
-                "DVE_SCALE_Y_U": {"baked_sample_count": 212, "keyframed": True},
-                "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
-                "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
-                "AvidParameterByteOrder": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "DVE_BORDER_ENABLED_U": {"baked_sample_count": None,
-                                         "keyframed": False},
-                "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None,
-                                             "keyframed": False},
-                "DVE_ROT_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_ROT_X_U": {"baked_sample_count": 159, "keyframed": True},
-                "DVE_ROT_Y_U": {"baked_sample_count": 159, "keyframed": True},
-                "DVE_ROT_Z_U": {"baked_sample_count": 159, "keyframed": True},
-                "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
-                "Vergence": {"baked_sample_count": 159, "keyframed": True},
-            },
-            {
-                "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
-                "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
-                "AvidParameterByteOrder": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "DVE_BORDER_ENABLED_U": {"baked_sample_count": None,
-                                         "keyframed": False},
-                "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None,
-                                             "keyframed": False},
-                "DVE_POS_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_POS_X_U": {"baked_sample_count": 116, "keyframed": True},
-                "DVE_POS_Y_U": {"baked_sample_count": 116, "keyframed": True},
-                "DVE_POS_Z_U": {"baked_sample_count": 116, "keyframed": True},
-                "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
-                "Vergence": {"baked_sample_count": 116, "keyframed": True},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": 276, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 276,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": 182, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 182,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": 219, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 219,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": 193, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 193,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AvidMotionInputFormat": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "AvidMotionOutputFormat": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "AvidMotionPulldown": {"baked_sample_count": None, "keyframed": False},
-                "AvidPhase": {"baked_sample_count": None, "keyframed": False},
-                "PARAM_SPEED_MAP_U": {"baked_sample_count": 241, "keyframed": True},
-                "PARAM_SPEED_OFFSET_MAP_U": {"baked_sample_count": 241,
-                                             "keyframed": True},
-                "SpeedRatio": {"baked_sample_count": None, "keyframed": False},
-            },
-            {
-                "AFX_FIXED_ASPECT_U": {"baked_sample_count": None, "keyframed": False},
-                "AvidEffectID": {"baked_sample_count": None, "keyframed": False},
-                "AvidParameterByteOrder": {"baked_sample_count": None,
-                                           "keyframed": False},
-                "DVE_BORDER_ENABLED_U": {"baked_sample_count": None,
-                                         "keyframed": False},
-                "DVE_DEFOCUS_MODE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_FG_KEY_HIGH_SAT_U": {"baked_sample_count": None,
-                                          "keyframed": False},
-                "DVE_MT_WARP_FOREGROUND_U": {"baked_sample_count": None,
-                                             "keyframed": False},
-                "DVE_PRSP_ENABLED_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_PRSP_X_U": {"baked_sample_count": 241, "keyframed": True},
-                "DVE_PRSP_Y_U": {"baked_sample_count": 241, "keyframed": True},
-                "DVE_PRSP_Z_U": {"baked_sample_count": 241, "keyframed": True},
-                "DVE_TRACKING_POS_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_AMPLT_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_CURVE_U": {"baked_sample_count": None, "keyframed": False},
-                "DVE_WARP_FREQ_U": {"baked_sample_count": None, "keyframed": False},
-                "Vergence": {"baked_sample_count": 241, "keyframed": True},
-            },
-        ]
-
-        self.assertEqual(get_expected_dict(tl_unbaked), expected_unbaked)
-        self.assertEqual(get_expected_dict(tl_baked), expected_baked)
+        self.assertEqual(
+            get_expected_dict(tl_unbaked), _KEYFRAMED_EXPECTED_UNBAKED
+        )
+        self.assertEqual(get_expected_dict(tl_baked), _KEYFRAMED_EXPECTED_BAKED)
 
     def test_non_av_track_kind(self):
-        timeline = otio.adapters.read_from_file(AVID_DATA_TRACK_EXAMPLE_PATH)
+        timeline = _cached_read(AVID_DATA_TRACK_EXAMPLE_PATH)
         self.assertEqual([t.kind for t in timeline.tracks],
                          ["Video", "AAF_DataEssenceTrack"]
                          )
 
 
+@unittest.skipIf(
+    not could_import_aaf,
+    "AAF module not found. You might need to set OTIO_AAF_PYTHON_LIB"
+)
+class AAFFlattenTracksTests(unittest.TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        # flatten_stack runs over these, so work on private copies
+        cls.multitrack_timeline = _read(
+            MULTITRACK_EXAMPLE_PATH, attach_markers=False
+        )
+        cls.preflattened_timeline = _read(
+            PREFLATTENED_EXAMPLE_PATH, attach_markers=False
+        )
+        cls.preflattened = cls.preflattened_timeline.video_tracks()[0]
+        cls.flattened = otio.algorithms.flatten_stack(
+            cls.multitrack_timeline.video_tracks()
+        )
+
+    def test_aaf_flatten_tracks_structure(self):
+        # first make sure we got the structure we expected
+        self.assertEqual(3, len(self.preflattened_timeline.tracks))
+        self.assertEqual(1, len(self.preflattened_timeline.video_tracks()))
+        self.assertEqual(2, len(self.preflattened_timeline.audio_tracks()))
+
+        self.assertEqual(3, len(self.multitrack_timeline.video_tracks()))
+        self.assertEqual(2, len(self.multitrack_timeline.audio_tracks()))
+        self.assertEqual(8, len(self.multitrack_timeline.tracks))
+
+    def test_aaf_flatten_tracks_length(self):
+        self.assertEqual(7, len(self.preflattened))
+        self.assertEqual(7, len(self.flattened))
+
+    def test_aaf_flatten_tracks(self):
+        # The cleanup below mutates the tracks, so work on copies to keep the
+        # shared class fixtures intact.
+        preflattened = copy.deepcopy(self.preflattened)
+        flattened = copy.deepcopy(self.flattened)
+
+        # Lets remove some AAF metadata that will always be different
+        # so we can compare everything else.
+        for t in (preflattened, flattened):
+
+            t.name = ""
+            t.metadata.pop("AAF", None)
+
+            for c in t.find_children():
+                mr = getattr(c, "media_reference", None)
+                if mr:
+                    mr.metadata.get("AAF", {}).pop('LastModified', None)
+                meta = c.metadata.get("AAF", {})
+                for key in _FLATTEN_IGNORED_AAF_KEYS:
+                    meta.pop(key, None)
+
+            # We don't care about Gap start times, only their duration matters
+            for g in t.find_children(descended_from_type=otio.schema.Gap):
+                dur = g.source_range.duration
+                rate = g.source_range.start_time.rate
+                g.source_range = otio.opentime.TimeRange(
+                    otio.opentime.RationalTime(0, rate),
+                    dur
+                )
+
+        self.assertEqual(
+            json.loads(preflattened.to_json_string()),
+            json.loads(flattened.to_json_string())
+        )
+
+
 class AAFWriterTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self._tmp_counter = itertools.count()
+
+    def _aaf_path(self):
+        """Return a fresh .aaf path in the test's temporary directory."""
+        return os.path.join(
+            self._tmp_dir.name,
+            f"{self._testMethodName}_{next(self._tmp_counter)}.aaf"
+        )
+
     def test_aaf_writer_gaps(self):
-        otio_timeline = otio.adapters.read_from_file(GAPS_OTIO_PATH)
-        fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        otio_timeline = _read(GAPS_OTIO_PATH)
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
         self._verify_aaf(tmp_aaf_path)
 
@@ -1712,38 +1565,33 @@ class AAFWriterTests(unittest.TestCase):
         self._verify_aaf(DUPLICATES_PATH)
 
     def test_aaf_writer_nometadata(self):
-        def _target_url_fixup(timeline):
-            # fixes up relative paths to be absolute to this test file
-            test_dir = os.path.dirname(os.path.abspath(__file__))
-            for clip in timeline.find_clips():
-                target_url_str = clip.media_reference.target_url
-                clip.media_reference.target_url = os.path.join(test_dir, target_url_str)
-
         # Exercise getting Mob IDs from AAF files
-        otio_timeline = otio.adapters.read_from_file(NO_METADATA_OTIO_PATH)
+        otio_timeline = _read(NO_METADATA_OTIO_PATH)
         _target_url_fixup(otio_timeline)
-        fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
         self._verify_aaf(tmp_aaf_path)
 
+    def test_aaf_writer_nometadata_not_aaf(self):
         # Expect exception to raise on non AAF files with no metadata
-        otio_timeline = otio.adapters.read_from_file(NOT_AAF_OTIO_PATH)
+        otio_timeline = _read(NOT_AAF_OTIO_PATH)
         _target_url_fixup(otio_timeline)
-        fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         with self.assertRaises(AAFAdapterError):
             otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
 
+    def test_aaf_writer_nometadata_empty_mob_ids(self):
         # Generate empty Mob IDs fallback for not crashing
-        otio_timeline = otio.adapters.read_from_file(NOT_AAF_OTIO_PATH)
+        otio_timeline = _read(NOT_AAF_OTIO_PATH)
         _target_url_fixup(otio_timeline)
-        fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(otio_timeline, tmp_aaf_path, use_empty_mob_ids=True)
         self._verify_aaf(tmp_aaf_path)
 
     def test_fail_on_precheck(self):
         # Expect exception to raise on null available_range and rate mismatch
-        otio_timeline = otio.adapters.read_from_file(PRECHECK_FAIL_OTIO)
-        fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        otio_timeline = _read(PRECHECK_FAIL_OTIO)
+        tmp_aaf_path = self._aaf_path()
         try:
             otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
         except AAFValidationError as e:
@@ -1753,17 +1601,10 @@ class AAFWriterTests(unittest.TestCase):
                 raise e
 
     def test_aaf_roundtrip_first_clip(self):
-        def _target_url_fixup(timeline):
-            # fixes up relative paths to be absolute to this test file
-            test_dir = os.path.dirname(os.path.abspath(__file__))
-            for clip in timeline.find_clips():
-                target_url_str = clip.media_reference.target_url
-                clip.media_reference.target_url = os.path.join(test_dir, target_url_str)
-
         # Exercise getting Mob IDs from AAF files
-        otio_timeline = otio.adapters.read_from_file(NO_METADATA_OTIO_PATH)
+        otio_timeline = _read(NO_METADATA_OTIO_PATH)
         _target_url_fixup(otio_timeline)
-        fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
         self._verify_first_clip(otio_timeline, tmp_aaf_path)
 
@@ -1805,21 +1646,16 @@ class AAFWriterTests(unittest.TestCase):
         tl = otio.schema.Timeline()
         cl = otio.schema.Clip("clip0", metadata=metadata)
 
-        cl.source_range = otio.opentime.TimeRange(
-            otio.opentime.RationalTime(0, 24),
-            otio.opentime.RationalTime(100, 24),
-        )
+        cl.source_range = _WRITER_CLIP_RANGE
         tl.tracks.append(otio.schema.Track(kind='Video'))
         tl.tracks[0].append(cl)
         cl.media_reference = otio.schema.ExternalReference(target_url,
                                                            cl.source_range)
 
-        fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(tl, tmp_aaf_path)
 
-        self._verify_aaf(tmp_aaf_path)
-
-        with aaf2.open(tmp_aaf_path) as dest:
+        def _check_mastermob(dest):
             mastermob = dest.content.mobs.get(mob_id, None)
             self.assertNotEqual(mastermob, None)
             self.assertEqual(cl.name, mastermob.name)
@@ -1832,27 +1668,21 @@ class AAFWriterTests(unittest.TestCase):
             locator = filemob.descriptor['Locator'].value[0]
             self.assertEqual(locator['URLString'].value, target_url)
 
+        self._verify_aaf(tmp_aaf_path, check=_check_mastermob)
+
     def test_generator_reference(self):
         tl = otio.schema.Timeline()
         cl = otio.schema.Clip()
-        cl.source_range = otio.opentime.TimeRange(
-            otio.opentime.RationalTime(0, 24),
-            otio.opentime.RationalTime(100, 24),
-        )
+        cl.source_range = _WRITER_CLIP_RANGE
         tl.tracks.append(otio.schema.Track())
         tl.tracks[0].append(cl)
         cl.media_reference = otio.schema.GeneratorReference()
         cl.media_reference.generator_kind = "Slug"
-        cl.media_reference.available_range = otio.opentime.TimeRange(
-            otio.opentime.RationalTime(0, 24),
-            otio.opentime.RationalTime(100, 24),
-        )
-        _, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
-
-        mod = otio.adapters.from_name('AAF').module()
+        cl.media_reference.available_range = _WRITER_CLIP_RANGE
+        tmp_aaf_path = self._aaf_path()
 
         self.assertTrue(
-            mod.aaf_writer._is_considered_gap(cl)
+            advanced_authoring_format.aaf_writer._is_considered_gap(cl)
         )
 
         otio.adapters.write_to_file(tl, tmp_aaf_path)
@@ -1865,10 +1695,7 @@ class AAFWriterTests(unittest.TestCase):
     def test_aaf_writer_user_comments(self):
         # construct simple timeline
         timeline = otio.schema.Timeline()
-        range = otio.opentime.TimeRange(
-            otio.opentime.RationalTime(0, 24),
-            otio.opentime.RationalTime(100, 24),
-        )
+        range = _WRITER_CLIP_RANGE
         media_ref = otio.schema.ExternalReference(available_range=range)
         clip = otio.schema.Clip(source_range=range)
         clip.media_reference = media_ref
@@ -1897,7 +1724,7 @@ class AAFWriterTests(unittest.TestCase):
         timeline.metadata["AAF"] = {"UserComments": original_comments}
         media_ref.metadata["AAF"] = {"UserComments": original_comments}
 
-        _, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(timeline, tmp_aaf_path, use_empty_mob_ids=True)
 
         with aaf2.open(tmp_aaf_path) as aaf_file:
@@ -1908,12 +1735,12 @@ class AAFWriterTests(unittest.TestCase):
 
     def test_aaf_writer_metadata_roundtrip(self):
         """Tries to roundtrip metadata through AAF and `MobAttributeList`."""
-        og_aaf_tl = otio.adapters.read_from_file(ONE_AUDIO_CLIP_PATH)
+        og_aaf_tl = _read(ONE_AUDIO_CLIP_PATH)
         clip = og_aaf_tl.find_clips()[0]
 
         # change a value to test roundtrip
         clip.media_reference.metadata["AAF"]["MobAttributeList"]["_USER_POS"] = 2
-        _, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(og_aaf_tl, tmp_aaf_path)
 
         roundtripped_tl = otio.adapters.read_from_file(tmp_aaf_path)
@@ -1930,6 +1757,7 @@ class AAFWriterTests(unittest.TestCase):
         self.assertEqual(clip.media_reference.metadata["AAF"]["MobAttributeList"],
                          expected)
 
+    @pytest.mark.slow
     def test_aaf_writer_global_start_time(self):
         for tc, rate in [("01:00:00:00", 23.97),
                          ("01:00:00:00", 24),
@@ -1938,13 +1766,13 @@ class AAFWriterTests(unittest.TestCase):
                          ("01:00:00:00", 30),
                          ("01:00:00:00", 59.94),
                          ("01:00:00:00", 60)]:
+            with self.subTest(tc=tc, rate=rate):
+                otio_timeline = otio.schema.Timeline()
+                otio_timeline.global_start_time = otio.opentime.from_timecode(tc, rate)
+                tmp_aaf_path = self._aaf_path()
+                otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
 
-            otio_timeline = otio.schema.Timeline()
-            otio_timeline.global_start_time = otio.opentime.from_timecode(tc, rate)
-            fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
-            otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
-
-            self._verify_aaf(tmp_aaf_path)
+                self._verify_aaf(tmp_aaf_path)
 
         for frame, rate in [(100, 12.97),
                             (100, 3.0),
@@ -1953,13 +1781,15 @@ class AAFWriterTests(unittest.TestCase):
                             (100, 45),
                             (100, 120.0),
                             (100, 90.0)]:
+            with self.subTest(frame=frame, rate=rate):
+                otio_timeline = otio.schema.Timeline()
+                otio_timeline.global_start_time = otio.opentime.RationalTime(
+                    frame, rate
+                )
+                tmp_aaf_path = self._aaf_path()
+                otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
 
-            otio_timeline = otio.schema.Timeline()
-            otio_timeline.global_start_time = otio.opentime.RationalTime(frame, rate)
-            fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
-            otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
-
-            self._verify_aaf(tmp_aaf_path)
+                self._verify_aaf(tmp_aaf_path)
 
     def test_aaf_writer_audio_pan(self):
         """Test Clip with custom audio pan values"""
@@ -1969,16 +1799,11 @@ class AAFWriterTests(unittest.TestCase):
         clip = otio.schema.Clip(
             name="Panned Audio Clip",
             metadata={},
-            source_range=otio.opentime.TimeRange(
-                start_time=otio.opentime.RationalTime(0, 24),
-                duration=otio.opentime.RationalTime(100, 24),
-            )
+            source_range=_WRITER_CLIP_RANGE
         )
         clip.media_reference = otio.schema.MissingReference(
-            available_range=otio.opentime.TimeRange(
-                start_time=otio.opentime.RationalTime(0, 24),
-                duration=otio.opentime.RationalTime(100, 24),
-            ))
+            available_range=_WRITER_CLIP_RANGE
+        )
 
         # Add pan metadata
         clip.metadata["AAF"] = {
@@ -2004,7 +1829,7 @@ class AAFWriterTests(unittest.TestCase):
             otio.schema.Track(children=[clip], kind=otio.schema.TrackKind.Audio)
         )
 
-        _, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(tl, tmp_aaf_path)
         print(tmp_aaf_path)
 
@@ -2035,10 +1860,7 @@ class AAFWriterTests(unittest.TestCase):
         """Tests custom values for essence descriptor
         """
         tl = otio.schema.Timeline()
-        range = otio.opentime.TimeRange(
-            start_time=otio.opentime.RationalTime(0, 24),
-            duration=otio.opentime.RationalTime(100, 24),
-        )
+        range = _WRITER_CLIP_RANGE
         clip = otio.schema.Clip(source_range=range)
         clip.media_reference = otio.schema.MissingReference(available_range=range)
         tl.tracks.append(otio.schema.Track())
@@ -2054,28 +1876,34 @@ class AAFWriterTests(unittest.TestCase):
         }
 
         # write to temp AAf file
-        _, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(tl, tmp_aaf_path)
 
         # check if essence descriptor parameters in AAF file match
         with aaf2.open(tmp_aaf_path) as aaf_file:
-            source_mob = list(aaf_file.content.sourcemobs())[1]
+            source_mob = next(itertools.islice(aaf_file.content.sourcemobs(), 1, 2))
             self.assertEqual(source_mob.descriptor['Length'].value, 100)
             self.assertEqual(source_mob.descriptor['SampleRate'].value, 48)
 
-    def _verify_aaf(self, aaf_path):
+    def _verify_aaf(self, aaf_path, check=None):
+        """Round trip ``aaf_path`` and compare the result with the original.
+
+        ``check`` is called with the open ``aaf_path`` file, so callers with
+        extra assertions about it do not have to open it a second time.
+        """
         otio_timeline = otio.adapters.read_from_file(aaf_path, simplify=True)
-        fd, tmp_aaf_path = tempfile.mkstemp(suffix='.aaf')
+        tmp_aaf_path = self._aaf_path()
         otio.adapters.write_to_file(otio_timeline, tmp_aaf_path)
 
         with aaf2.open(tmp_aaf_path) as dest, aaf2.open(aaf_path) as orig:
+            compositionmobs = list(dest.content.compositionmobs())
+
             # Basic number of mobs should be equal
             self.assertEqual(len(list(orig.content.compositionmobs())),
-                             len(list(dest.content.compositionmobs())))
+                             len(compositionmobs))
             self.assertEqual(len(list(orig.content.mastermobs())),
                              len(list(dest.content.mastermobs())))
 
-            compositionmobs = list(dest.content.compositionmobs())
             self.assertEqual(1, len(compositionmobs))
             compositionmob = compositionmobs[0]
 
@@ -2086,12 +1914,8 @@ class AAFWriterTests(unittest.TestCase):
                                                         compositionmob.slots):
 
                 media_kind = aaf_timeline_mobslot.media_kind.lower()
-                self.assertTrue(media_kind in ["picture", "sound"])
-                kind_mapping = {
-                    "picture": otio.schema.TrackKind.Video,
-                    "sound": otio.schema.TrackKind.Audio
-                }
-                self.assertEqual(otio_track.kind, kind_mapping[media_kind])
+                self.assertTrue(media_kind in _KIND_MAPPING)
+                self.assertEqual(otio_track.kind, _KIND_MAPPING[media_kind])
 
                 sequence = None
                 if media_kind == "picture":
@@ -2100,26 +1924,17 @@ class AAFWriterTests(unittest.TestCase):
                     opgroup = aaf_timeline_mobslot.segment
                     self.assertTrue(isinstance(opgroup, OperationGroup))
                     input_segments = opgroup.segments
-                    self.assertTrue(hasattr(input_segments, "__iter__"))
+                    self.assertIsInstance(input_segments, collections.abc.Iterable)
                     self.assertTrue(len(input_segments) >= 1)
                     sequence = opgroup.segments[0]
                 self.assertTrue(isinstance(sequence, Sequence))
 
-                self.assertEqual(
-                    len(otio_track.find_children(shallow_search=True)),
-                    len(sequence.components))
-                for otio_child, aaf_component in zip(
-                        otio_track.find_children(shallow_search=True),
-                        sequence.components):
-                    type_mapping = {
-                        otio.schema.Clip: aaf2.components.SourceClip,
-                        otio.schema.Transition: aaf2.components.Transition,
-                        otio.schema.Gap: aaf2.components.Filler,
-                        otio.schema.Stack: aaf2.components.OperationGroup,
-                        otio.schema.Track: aaf2.components.OperationGroup
-                    }
+                otio_children = otio_track.find_children(shallow_search=True)
+                self.assertEqual(len(otio_children), len(sequence.components))
+                for otio_child, aaf_component in zip(otio_children,
+                                                     sequence.components):
                     self.assertEqual(type(aaf_component),
-                                     type_mapping[type(otio_child)])
+                                     _TYPE_MAPPING[type(otio_child)])
 
                     if isinstance(aaf_component, SourceClip):
                         self._verify_compositionmob_sourceclip_structure(otio_child,
@@ -2144,6 +1959,9 @@ class AAFWriterTests(unittest.TestCase):
                     self.assertTrue(slot.segment.fps in [24, 25, 30, 60])
                     self.assertTrue(slot['PhysicalTrackNumber'].value == 1)
 
+            if check is not None:
+                check(orig)
+
         # Inspect the OTIO -> AAF -> OTIO file
         roundtripped_otio = otio.adapters.read_from_file(tmp_aaf_path, simplify=True)
 
@@ -2183,11 +2001,11 @@ class AAFWriterTests(unittest.TestCase):
                 self.assertEqual(locator['URLString'].value,
                                  otio_child.media_reference.target_url)
 
-            timecode_slots = [tape_slot for tape_slot in tapemob.slots
-                              if isinstance(tape_slot.segment,
-                                            Timecode)]
-
-            self.assertEqual(1, len(timecode_slots))
+            timecode_slot_count = sum(
+                1 for tape_slot in tapemob.slots
+                if isinstance(tape_slot.segment, Timecode)
+            )
+            self.assertEqual(1, timecode_slot_count)
 
             for tape_slot in tapemob.slots:
                 tapemob_component = tape_slot.segment
@@ -2212,8 +2030,8 @@ class AAFWriterTests(unittest.TestCase):
         if isinstance(aaf_component, Transition):
             orig_pointlist = otio_child.metadata["AAF"]["PointList"]
             params = aaf_component["OperationGroup"].value.parameters
-            varying_value = [param for param in params if isinstance(param,
-                                                                     VaryingValue)][0]
+            varying_value = next(param for param in params
+                                 if isinstance(param, VaryingValue))
             dest_pointlist = varying_value.getvalue("PointList")
             for orig_point, dest_point in zip(orig_pointlist, dest_pointlist):
                 self.assertEqual(orig_point["Value"], dest_point.value)
@@ -2223,14 +2041,15 @@ class AAFWriterTests(unittest.TestCase):
 class SimplifyTests(unittest.TestCase):
     def test_aaf_simplify(self):
         aaf_path = SIMPLE_EXAMPLE_PATH
-        timeline = otio.adapters.read_from_file(aaf_path, simplify=True)
+        timeline = _cached_read(aaf_path, simplify=True)
         self.assertIsNotNone(timeline)
         self.assertEqual(type(timeline), otio.schema.Timeline)
         self.assertEqual(timeline.name, "OTIO TEST 1.Exported.01")
-        fps = timeline.duration().rate
+        duration = timeline.duration()
+        fps = duration.rate
         self.assertEqual(fps, 24.0)
         self.assertEqual(
-            timeline.duration(),
+            duration,
             otio.opentime.from_timecode("00:02:16:18", fps)
         )
         self.assertEqual(len(timeline.tracks), 3)
@@ -2243,17 +2062,18 @@ class SimplifyTests(unittest.TestCase):
 
     def test_aaf_no_simplify(self):
         aaf_path = SIMPLE_EXAMPLE_PATH
-        collection = otio.adapters.read_from_file(aaf_path, simplify=False)
+        collection = _cached_read(aaf_path, simplify=False)
         self.assertIsNotNone(collection)
         self.assertEqual(type(collection), otio.schema.SerializableCollection)
         self.assertEqual(len(collection), 1)
 
         timeline = collection[0]
         self.assertEqual(timeline.name, "OTIO TEST 1.Exported.01")
-        fps = timeline.duration().rate
+        duration = timeline.duration()
+        fps = duration.rate
         self.assertEqual(fps, 24.0)
         self.assertEqual(
-            timeline.duration(),
+            duration,
             otio.opentime.from_timecode("00:02:16:18", fps)
         )
 
@@ -2276,7 +2096,7 @@ class SimplifyTests(unittest.TestCase):
         """
 
         # get the simplified form of the clip
-        tl = otio.adapters.read_from_file(ONE_AUDIO_CLIP_PATH, simplify=True)
+        tl = _cached_read(ONE_AUDIO_CLIP_PATH, simplify=True)
 
         # ensure that we end up with a track that contains a clip
         self.assertEqual(type(tl.tracks[0]), otio.schema.Track)
@@ -2284,27 +2104,21 @@ class SimplifyTests(unittest.TestCase):
         self.assertEqual(type(tl.tracks[0][0]), otio.schema.Clip)
 
     def test_simplify_track_stack_track(self):
-        tl = otio.schema.Timeline()
-        tl.tracks.append(otio.schema.Track())
-        tl.tracks[0].append(otio.schema.Stack())
-        tl.tracks[0][0].append(otio.schema.Track())
-        tl.tracks[0][0][0].append(otio.schema.Clip())
+        inner = otio.schema.Track(children=[otio.schema.Clip()])
+        stack = otio.schema.Stack(children=[inner])
+        tl = otio.schema.Timeline(tracks=[otio.schema.Track(children=[stack])])
 
-        from otio_aaf_adapter.adapters import advanced_authoring_format
         simple_tl = advanced_authoring_format._simplify(tl)
 
         self.assertEqual(
             type(simple_tl.tracks[0][0]), otio.schema.Clip
         )
 
-        tl = otio.schema.Timeline()
-        tl.tracks.append(otio.schema.Track())
-        tl.tracks[0].append(otio.schema.Stack())
-        tl.tracks[0][0].append(otio.schema.Track())
-        tl.tracks[0][0][0].append(otio.schema.Track())
-        tl.tracks[0][0][0][0].append(otio.schema.Clip())
+        inner = otio.schema.Track(children=[otio.schema.Clip()])
+        inner = otio.schema.Track(children=[inner])
+        stack = otio.schema.Stack(children=[inner])
+        tl = otio.schema.Timeline(tracks=[otio.schema.Track(children=[stack])])
 
-        from otio_aaf_adapter.adapters import advanced_authoring_format
         simple_tl = advanced_authoring_format._simplify(tl)
 
         # top level thing should not be a clip
@@ -2316,13 +2130,9 @@ class SimplifyTests(unittest.TestCase):
         )
 
     def test_simplify_stack_clip_clip(self):
-        tl = otio.schema.Timeline()
-        tl.tracks.append(otio.schema.Track())
-        tl.tracks[0].append(otio.schema.Stack())
-        tl.tracks[0][0].append(otio.schema.Clip())
-        tl.tracks[0][0].append(otio.schema.Clip())
+        stack = otio.schema.Stack(children=[otio.schema.Clip(), otio.schema.Clip()])
+        tl = otio.schema.Timeline(tracks=[otio.schema.Track(children=[stack])])
 
-        from otio_aaf_adapter.adapters import advanced_authoring_format
         simple_tl = advanced_authoring_format._simplify(tl)
 
         self.assertNotEqual(
@@ -2333,21 +2143,37 @@ class SimplifyTests(unittest.TestCase):
         )
 
     def test_simplify_stack_track_clip(self):
-        tl = otio.schema.Timeline()
-        tl.tracks.append(otio.schema.Track())
-        tl.tracks[0].append(otio.schema.Stack())
-        tl.tracks[0][0].append(otio.schema.Track())
-        tl.tracks[0][0][0].append(otio.schema.Clip())
-        tl.tracks[0][0].append(otio.schema.Track())
-        tl.tracks[0][0][1].append(otio.schema.Clip())
+        stack = otio.schema.Stack(children=[
+            otio.schema.Track(children=[otio.schema.Clip()]),
+            otio.schema.Track(children=[otio.schema.Clip()]),
+        ])
+        tl = otio.schema.Timeline(tracks=[otio.schema.Track(children=[stack])])
 
-        from otio_aaf_adapter.adapters import advanced_authoring_format
         simple_tl = advanced_authoring_format._simplify(tl)
 
         # None of the things in the top level stack should be a clip
         for i in simple_tl.tracks:
             self.assertNotEqual(type(i), otio.schema.Clip)
 
+    def test_simplify_flat_timeline(self):
+        tl = otio.schema.Timeline(tracks=[
+            otio.schema.Track(children=[otio.schema.Clip(), otio.schema.Gap()]),
+            otio.schema.Track(children=[otio.schema.Clip()]),
+        ])
+        tracks = list(tl.tracks)
+
+        simple_tl = advanced_authoring_format._simplify(tl)
+
+        # an already flat timeline is left untouched
+        self.assertEqual(list(simple_tl.tracks), tracks)
+        self.assertEqual(len(simple_tl.tracks[0]), 2)
+
+        # a track with nothing but gaps still gets removed
+        tl.tracks.append(otio.schema.Track(children=[otio.schema.Gap()]))
+        simple_tl = advanced_authoring_format._simplify(tl)
+
+        self.assertEqual(list(simple_tl.tracks), tracks)
+
 
 if __name__ == '__main__':
     unittest.main()